@@ -0,0 +1,41 @@
+# encoding: utf-8
+"""
+Helpers for benchmarks that run the engine offscreen (headless mode: requires pi3d,
+pyliblo3 and an EGL implementation such as mesa's, but no display server).
+"""
+
+import numpy
+
+def create_engine(**kwargs):
+    """
+    Create a headless engine (osc server on a random port)
+    """
+    import pi3d
+    from pytaVSL.engine.core import PytaVSL
+
+    pi3d.Log(name=None, level='WARNING')
+
+    options = dict(name='bench', port=None, fps=60, width=640, height=360, headless=True)
+    options.update(kwargs)
+
+    return PytaVSL(**options)
+
+def create_slides(engine, count, visible=False, prefix='slide'):
+    """
+    Add count slides (small solid textures), spread across the stage
+    """
+    import pi3d
+    from pytaVSL.slides.slide import Slide
+
+    texture = pi3d.Texture(numpy.full((16, 16, 4), 255, dtype='uint8'))
+
+    slides = []
+    for i in range(count):
+        slide = Slide(parent=engine, name='%s_%05i' % (prefix, i), texture=texture, width=64, height=64, init_z=i / 1000.)
+        engine.add_slide(slide)
+        slide.set_position((i % 8 - 3.5) / 8., (i // 8 % 4 - 1.5) / 4., None)
+        if visible:
+            slide.set_visible(1)
+        slides.append(slide)
+
+    return slides
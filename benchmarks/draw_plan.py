@@ -0,0 +1,85 @@
+# encoding: utf-8
+"""
+Per-slide draw overhead: compiled draw plan (Slide.draw) vs the mixins' cooperative
+draw() chain, both compared with pi3d's Shape.draw alone (the actual drawing).
+Also measured with the actual drawing skipped (stages only), since with a software
+gpu driver (llvmpipe) rasterization runs on the cpu and its variance can hide the overhead.
+Run from the repository root: python -m benchmarks.draw_plan [--slides N] [--frames N] [--runs N]
+"""
+
+from timeit import repeat
+from argparse import ArgumentParser
+
+from pi3d.Shape import Shape
+
+from benchmarks.common import create_engine, create_slides
+from pytaVSL.slides.slide import Slide
+
+def measure(methods, frames, runs):
+    """
+    Return the best duration of each method (runs are interleaved so that drifts
+    such as cpu frequency changes affect all methods alike)
+    """
+    best = {}
+    for run in range(runs):
+        for name, method in methods:
+            duration = repeat(method, number=frames, repeat=1)[0]
+            if name not in best or duration < best[name]:
+                best[name] = duration
+    return best
+
+def main():
+
+    parser = ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--slides', type=int, default=50, help='visible slide count')
+    parser.add_argument('--frames', type=int, default=200, help='draws per slide and run')
+    parser.add_argument('--runs', type=int, default=5, help='runs per method (best run is reported)')
+    args = parser.parse_args()
+
+    engine = create_engine()
+    slides = create_slides(engine, args.slides, visible=True)
+
+    # first draw: texture upload
+    for slide in slides:
+        slide.draw()
+
+    def draw_shape():
+        for slide in slides:
+            Shape.draw(slide)
+
+    def draw_chain():
+        for slide in slides:
+            super(Slide, slide).draw()
+
+    def draw_plan():
+        for slide in slides:
+            slide.draw()
+
+    count = args.slides * args.frames
+
+    print('%i slides, %i draws per slide, best of %i runs' % (args.slides, args.frames, args.runs))
+    print('%-20s %12s %14s' % ('', 'draw (us)', 'overhead (us)'))
+
+    best = measure([('shape', draw_shape), ('chain', draw_chain), ('plan', draw_plan)], args.frames, args.runs)
+    shape = best['shape'] / count * 1000000.
+    print('%-20s %12.2f %14s' % ('Shape.draw', shape, '-'))
+    for name, label in [('chain', 'mixins draw chain'), ('plan', 'compiled draw plan')]:
+        duration = best[name] / count * 1000000.
+        print('%-20s %12.2f %14.2f' % (label, duration, duration - shape))
+
+    # stages only: both paths look Shape.draw up when calling it
+    draw = Shape.draw
+    Shape.draw = lambda *args, **kwargs: None
+    try:
+        best = measure([('chain', draw_chain), ('plan', draw_plan)], args.frames, args.runs)
+    finally:
+        Shape.draw = draw
+
+    print('%-20s %12s' % ('stages only', 'time (us)'))
+    for name, label in [('chain', 'mixins draw chain'), ('plan', 'compiled draw plan')]:
+        print('%-20s %12.2f' % (label, best[name] / count * 1000000.))
+
+    engine.stop()
+
+if __name__ == '__main__':
+    main()
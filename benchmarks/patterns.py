@@ -0,0 +1,55 @@
+# encoding: utf-8
+"""
+Address pattern lookups over a large slide set: OscStore's name index vs a regexp scan.
+Run from the repository root: python -m benchmarks.patterns [names]
+"""
+
+import sys
+import random
+from timeit import timeit
+
+from pytaVSL.engine.patterns import OscStore, osc_to_regexp
+
+PATTERNS = [
+    'act2_bg_*',
+    'act2_bg_01[0-9]',
+    'act{1,3}_fx_00*',
+    '{act1_bg_001,act4_tx_500,act5_fg_999}',
+    'act?_bg_017',
+    '*_tx_017',
+]
+
+def scan(store, pattern):
+    regexp = osc_to_regexp(pattern)
+    return [store[name] for name in store if name and regexp.match(name)]
+
+def main(count=10000):
+
+    kinds = ['bg', 'fg', 'fx', 'tx']
+    names = ['act%i_%s_%03i' % (i % 5 + 1, kinds[i // 5 % 4], i // 20) for i in range(count)]
+    random.seed(0)
+    random.shuffle(names)
+
+    store = OscStore()
+    for name in names:
+        store[name] = name
+
+    print('%i names' % len(store))
+    print('%-40s %8s %10s %10s' % ('pattern', 'matches', 'scan (ms)', 'index (ms)'))
+
+    for pattern in PATTERNS:
+
+        def index():
+            store.matches.clear()
+            return store.match(pattern)
+
+        assert index() == scan(store, pattern), pattern
+
+        number = 20
+        scan_time = timeit(lambda: scan(store, pattern), number=number) / number * 1000.
+        index_time = timeit(index, number=number) / number * 1000.
+
+        print('%-40s %8i %10.3f %10.3f' % (pattern, len(index()), scan_time, index_time))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+# encoding: utf-8
+"""
+Frame cost as the number of hidden slides grows (visible slide count unchanged).
+The render loop only walks drawable slides: frame cost should stay flat.
+Each configuration runs the engine's main loop offline (fixed-step clock, no waiting)
+in a separate process.
+Run from the repository root: python -m benchmarks.render_loop [--hidden N [N ...]]
+"""
+
+import sys
+import subprocess
+from time import perf_counter
+from argparse import ArgumentParser, SUPPRESS
+
+from benchmarks.common import create_engine, create_slides
+
+def run(hidden, visible, frames):
+    """
+    Render frames offline and return the average frame duration (ms)
+    """
+    fps = 60
+    engine = create_engine(fps=fps, offline=True, offline_duration=frames / fps)
+
+    create_slides(engine, visible, visible=True, prefix='visible')
+    create_slides(engine, hidden, visible=False, prefix='hidden')
+
+    start = perf_counter()
+    engine.start()
+
+    return (perf_counter() - start) / frames * 1000.
+
+def main():
+
+    parser = ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--hidden', type=int, nargs='+', default=[0, 500, 1000, 2000, 4000], help='hidden slide counts')
+    parser.add_argument('--visible', type=int, default=15, help='visible slide count')
+    parser.add_argument('--frames', type=int, default=300, help='frames rendered per configuration')
+    parser.add_argument('--run', type=int, help=SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        # child process: single configuration
+        print(run(args.run, args.visible, args.frames))
+        return
+
+    print('%i visible slides, %i frames per run' % (args.visible, args.frames))
+    print('%8s %12s' % ('hidden', 'frame (ms)'))
+
+    for hidden in args.hidden:
+        output = subprocess.run([sys.executable, '-m', 'benchmarks.render_loop', '--run', str(hidden),
+                                 '--visible', str(args.visible), '--frames', str(args.frames)],
+                                stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        print('%8i %12.3f' % (hidden, float(output.strip().split('\n')[-1])))
+
+if __name__ == '__main__':
+    main()
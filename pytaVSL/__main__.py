@@ -37,7 +37,21 @@ pyta = PytaVSL(
     show_fps=config.show_fps,
     memtest=config.memtest,
     precompile_shaders=config.precompile,
-    audio=audio
+    audio=audio,
+    headless=config.headless,
+    offline=config.render is not None,
+    offline_script=config.render,
+    offline_output=config.render_output,
+    offline_duration=config.render_duration,
+    pacing=config.pacing,
+    gc_policy=config.gc_policy,
+    render_scale=config.render_scale,
+    quality_governor=config.quality_governor,
+    quality_order=config.quality_order,
+    metrics=config.metrics,
+    osc_time_budget=config.osc_budget,
+    osc_message_budget=config.osc_budget_messages,
+    osc_coalesce=config.osc_coalesce
 )
 
 if config.memtest and 'y' not in input('Warning: the memory test may freeze/crash your system, continue ? (y/N)').lower():
@@ -12,13 +12,26 @@ parser.add_argument('--load', help='image files to load', nargs='+', metavar='FI
 parser.add_argument('--text', help='text objects to create', nargs='+', metavar='NAME:FONT', default=["0:sans", "1:sans", "2:mono", "3:mono"])
 parser.add_argument('--scenes', help='scene files to load', nargs='+', metavar='FILES')
 parser.add_argument('--fps',  help='maximum framerate, 0 for free wheeling', type=int, default=25)
+parser.add_argument('--pacing',  help='frame pacing mode (hybrid: sleep then spin-wait for accurate frame timing, uses more cpu)', choices=['sleep', 'hybrid'], default='sleep')
+parser.add_argument('--gc-policy',  help='garbage collection policy (show: freeze objects after loading and run full collections between frames only)', choices=['auto', 'show'], default='auto')
+parser.add_argument('--render-scale',  help='render at a fraction of the output resolution and upscale the result (0.1 to 1)', type=float, default=1.0, metavar='SCALE')
+parser.add_argument('--quality-governor',  help='step costly features down when the framerate drops below target', default=False, action='store_true')
+parser.add_argument('--quality-order',  help='quality governor steps, in degradation order', nargs='+', choices=['blur', 'mesh', 'group_resolution', 'video_rate'], default=['blur', 'mesh', 'group_resolution', 'video_rate'], metavar='STEP')
+parser.add_argument('--metrics',  help='serve prometheus metrics on a local http port or unix socket path', type=str, default=None, metavar='PORT|PATH')
+parser.add_argument('--osc-budget',  help='maximum time spent processing osc messages per frame (in ms), 0 for unlimited', type=float, default=0, metavar='MS')
+parser.add_argument('--osc-budget-messages',  help='maximum number of osc messages processed per frame, 0 for unlimited', type=int, default=0, metavar='N')
+parser.add_argument('--osc-coalesce',  help='only apply the last set of a property among messages received between two frames', default=False, action='store_true')
 parser.add_argument('--precompile',  help='precompile effect shaders at startup', default=False, action='store_true')
 parser.add_argument('--max-vram',  help='maximum video memory allocation (in MB)', type=int, default=64)
 parser.add_argument('--memtest',  help='test video memory size', default=False, action='store_true')
+parser.add_argument('--headless',  help='render offscreen, without window nor display server', default=False, action='store_true')
+parser.add_argument('--render',  help='offline rendering: play osc script (lines of "<time> <address> [args ...]") with a fixed-step clock, as fast as possible (live osc input is ignored)', type=str, metavar='SCRIPT')
+parser.add_argument('--render-output',  help='offline rendering: video file to record', type=str, default='render.mp4', metavar='FILE')
+parser.add_argument('--render-duration',  help='offline rendering: duration in seconds, 0 for the script\'s duration', default=0, type=float, metavar='SECONDS')
 parser.add_argument('--fullscreen',  help='launch in fullscreen', default=False, action='store_true')
 parser.add_argument('--api',  help='print osc api and exit', default=False, action='store_true')
 parser.add_argument('--debug',  help='print debug logs', default=False, action='store_true')
-parser.add_argument('--show-fps',  help='show fps', default=False, action='store_true')
+parser.add_argument('--show-fps',  help='show performance overlay (fps, frame times, gpu memory, osc backlog)', default=False, action='store_true')
 parser.add_argument('--resolution',  help='output resolution', type=str, default='800x600', metavar='WIDTHxHEIGHT')
 parser.add_argument('--title',  help='window title', type=str, default='pytaVSL', metavar='TITLE')
 parser.add_argument('--audio',  help='enable audio playback of video slides (when visible), requires jack to be running', default=False, action='store_true')
@@ -32,7 +32,7 @@ class Camera(State,OscNode,Animable,FakeSlide):
         super().__init__()
 
     def update(self):
-        Animable.draw(self)
+        self.animations_update()
 
     def update_camera(self):
         for cam in self.cameras:
@@ -45,6 +45,8 @@ class Camera(State,OscNode,Animable,FakeSlide):
         # self.parent.post_process_bg.set_position_z(10000 - self.parent.height + self.pos_z)
         self.parent.post_process.set_position_x(self.pos_x / self.parent.width)
         self.parent.post_process.set_position_y(self.pos_y / self.parent.height)
+        self.parent.render_target.set_position_x(self.pos_x / self.parent.width)
+        self.parent.render_target.set_position_y(self.pos_y / self.parent.height)
         # self.parent.post_process.set_position_z(self.pos_z+0.00001)
 
     @osc_property('position', 'pos_x', 'pos_y', 'pos_z')
@@ -0,0 +1,129 @@
+# encoding: utf-8
+
+import gc
+from time import perf_counter
+from collections import deque
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+GC_POLICIES = ['auto', 'show']
+
+# generation 2 threshold used to disable automatic full collections
+GEN2_DISABLED = 1000000
+
+class GarbageCollector(object):
+    """
+    Garbage collection scheduling.
+    Policies:
+        - "auto": python's automatic collection, full collection when requested
+        - "show": objects alive after loading are frozen, automatic full collections are disabled
+                  and run in the frame's slack time instead. Frozen objects are released when
+                  slides are removed (so that they can be freed) and frozen again after collection.
+    """
+
+    def __init__(self, policy='auto', max_delay=5.0, window=100):
+
+        self.policy = policy if policy in GC_POLICIES else 'auto'
+        self.max_delay = max_delay
+
+        self.default_threshold = gc.get_threshold()
+
+        # full collection requested (or due) since
+        self.pending = None
+        # freeze objects still alive after next full collection
+        self.freeze_pending = False
+
+        # pause measurement
+        self.pause_start = 0
+        self.pauses = deque(maxlen=window)
+        self.last_pause = 0
+        self.last_full_pause = 0
+        self.count = 0
+
+        gc.callbacks.append(self.callback)
+
+        self.set_policy(self.policy)
+
+    def set_policy(self, policy):
+        if policy not in GC_POLICIES:
+            LOGGER.error('unknown gc policy "%s" (available: %s)' % (policy, ', '.join(GC_POLICIES)))
+            return
+
+        self.policy = policy
+
+        if policy == 'show':
+            gc.set_threshold(self.default_threshold[0], self.default_threshold[1], GEN2_DISABLED)
+            self.freeze()
+        else:
+            gc.set_threshold(*self.default_threshold)
+            gc.unfreeze()
+            self.freeze_pending = False
+
+    def callback(self, phase, info):
+        """
+        Measure collection pauses (called by the gc module)
+        """
+        if phase == 'start':
+            self.pause_start = perf_counter()
+        else:
+            self.last_pause = perf_counter() - self.pause_start
+            self.pauses.append(self.last_pause)
+            self.count += 1
+            if info['generation'] == 2:
+                self.last_full_pause = self.last_pause
+
+    def freeze(self):
+        """
+        Request a full collection after which objects still alive
+        are moved to the permanent generation (may be called from any thread)
+        """
+        if self.policy == 'show':
+            self.freeze_pending = True
+            self.request()
+
+    def release(self):
+        """
+        Request a full collection that can free frozen objects (removed slides)
+        """
+        if self.policy == 'show' and gc.get_freeze_count() > 0:
+            gc.unfreeze()
+            self.freeze_pending = True
+        self.request()
+
+    def request(self):
+        """
+        Request a full collection
+        """
+        if self.pending is None:
+            self.pending = perf_counter()
+
+    def collect(self, slack):
+        """
+        Run pending full collection if the time left before next frame allows it
+        (or if it has been delayed for too long)
+        """
+        if self.policy == 'show' and self.pending is None:
+            if gc.get_count()[2] >= self.default_threshold[2]:
+                # automatic full collection would have happened
+                self.request()
+
+        if self.pending is None:
+            return
+
+        if self.policy == 'show' and slack < self.last_full_pause and perf_counter() - self.pending < self.max_delay:
+            return
+
+        self.pending = None
+        gc.collect()
+
+        if self.freeze_pending and self.policy == 'show':
+            self.freeze_pending = False
+            gc.freeze()
+
+    def get_stats(self):
+        """
+        Return last, max and last full collection pauses (ms), and collection count
+        """
+        max_pause = max(self.pauses) if self.pauses else 0
+        return [self.last_pause * 1000., max_pause * 1000., self.last_full_pause * 1000., self.count]
@@ -2,29 +2,43 @@
 
 import pi3d
 from pi3d.constants import opengles, DISPLAY_CONFIG_FULLSCREEN, DISPLAY_CONFIG_DEFAULT, GL_CULL_FACE, GL_NO_ERROR
+from pi3d.util.Screenshot import screenshot
 import ctypes
 
 import glob
-from threading import Thread
+from threading import Thread, Lock
 import subprocess
 import sys
 from signal import signal, SIGINT, SIGTERM
 import traceback
-from time import time, sleep
+from time import time, sleep, perf_counter
+import random
 import numpy
 from contextlib import contextmanager
-import gc
 
 from ..shaders.shaders import init_shader_cache
 from ..slides.text import Text
 from ..slides.postprocess import PostProcess
 from ..slides.slide import Slide
+from ..slides.output import Output
+from ..slides.hud import Hud
+from ..slides.selection import SelectionOutline
 from ..engine.memory import MemoryMonitor
-from ..engine.osc import osc_method, osc_property
+from ..engine.osc import osc_method, osc_property, SUBSCRIBED_NODES
 from ..engine.server import OscServer
+from ..engine.patterns import OscStore
 from ..engine.scenes import Scenes
 from ..engine.recorder import Recorder
 from ..engine.camera import Camera
+from ..engine.zorder import ZOrderedList
+from ..engine.pacer import FramePacer
+from ..engine.collector import GarbageCollector
+from ..engine.headless import create_headless_display
+from ..engine.offline import OfflineRenderer
+from ..engine.governor import QualityGovernor, QUALITY_ORDER
+from ..engine.profiler import FrameProfiler
+from ..engine.scheduler import MediaScheduler
+from ..engine.metrics import MetricsServer
 from ..slides.text import FONTS
 
 import logging
@@ -38,19 +52,29 @@ class PytaVSL(Scenes, OscServer):
     It's also an OSC server which contains the method to control all of its children.
     """
 
-    def __init__(self, name='pyta', port=5555, fps=25, fullscreen=False, max_gpu_memory=64, width=800, height=600, window_title='pytaVSL', show_fps=False, memtest=False, precompile_shaders=False, audio=False):
+    def __init__(self, name='pyta', port=5555, fps=25, fullscreen=False, max_gpu_memory=64, width=800, height=600, window_title='pytaVSL', show_fps=False, memtest=False, precompile_shaders=False, audio=False, headless=False, offline=False, offline_script=None, offline_output=None, offline_duration=None, quality_governor=False, quality_order=QUALITY_ORDER, render_scale=1.0, pacing='sleep', gc_policy='auto', metrics=None, osc_time_budget=0, osc_message_budget=0, osc_coalesce=False):
 
-        super(PytaVSL, self).__init__(name, port)
+        super(PytaVSL, self).__init__(name, port, osc_time_budget=osc_time_budget, osc_message_budget=osc_message_budget, osc_coalesce=osc_coalesce)
 
         # setup OpenGL
         self.width = width
         self.height = height
 
-        self.DISPLAY = pi3d.Display.create(window_title=window_title, w=width, h=height, background=(0.0, 0.0, 0.0, 0.0), frames_per_second=0, depth=24, display_config=DISPLAY_CONFIG_FULLSCREEN if fullscreen else DISPLAY_CONFIG_DEFAULT, far=100000)
+        self.headless = headless
+        if headless:
+            self.DISPLAY = create_headless_display(w=width, h=height, background=(0.0, 0.0, 0.0, 0.0), depth=24, far=100000)
+        else:
+            self.DISPLAY = pi3d.Display.create(window_title=window_title, w=width, h=height, background=(0.0, 0.0, 0.0, 0.0), frames_per_second=0, depth=24, display_config=DISPLAY_CONFIG_FULLSCREEN if fullscreen else DISPLAY_CONFIG_DEFAULT, far=100000)
+        # time-based updates of active media
+        self.media_scheduler = MediaScheduler()
+        self.active_media = 0
+
         self.CAMERA = pi3d.Camera(is_3d=False, eye=(0, 0, -height))
         self.CAMERA3D = pi3d.Camera(is_3d=True, eye=(0, 0, -height), scale=0.8465)
         self.CAMERA.was_moved = False
         self.CAMERA3D.was_moved = False
+        # static camera for outputs
+        self.OUTPUT_CAMERA = pi3d.Camera(is_3d=False, eye=(0, 0, -height))
         self.camera = Camera('camera', self)
 
         # shader precompilation switch
@@ -63,45 +87,102 @@ class PytaVSL(Scenes, OscServer):
         opengles.glLineWidth(ctypes.c_float(2.0))
 
         self.time = time()
+        self.time_origin = self.time
+
+        # Z-sorted slides
+        self.sorted_slides = ZOrderedList()
+        self.z_rank_count = 0
+
+        # Z-sorted drawable slides (visible, including their parent groups)
+        self.visible_slides = ZOrderedList()
+
+        # Adaptive quality
+        self.governor = QualityGovernor(self, quality_order)
+        self.quality_governor = int(bool(quality_governor))
+        self.quality_order = self.governor.order
+        self.quality = ['full']
 
         global EMPTY_TEXTURE
         EMPTY_TEXTURE = pi3d.Texture(numpy.zeros((1,1,4), dtype='uint8'))
 
         self.post_process = PostProcess(self)
 
+        # reduced resolution rendering target (upscaled to the output)
+        self.render_target = PostProcess(self)
+        self.render_target.set_visible(1)
+        self.render_scale = 1.0
+
+        # output regions (sharing render_target's texture)
+        self.outputs = OscStore()
+
         # post process solid backgrund
         self.post_process_bg = Slide(parent=self, name='post_process_bg', texture=pi3d.Texture(numpy.ones((1,1,3), dtype='uint8')), width=self.width, height=self.height, init_z=10000-height)
         self.post_process_bg.set_color(0,0,0)
         self.post_process_bg.set_visible(1)
 
         # Slides
-        self.slides = {}
+        self.slides = OscStore()
 
         # Texts
-        self.texts = {}
+        self.texts = OscStore()
 
         self.debug_text = Text(self, 'debug', font=FONTS["mono"], init_z=-100)
         self.debug_text.set_size(0.025)
         self.debug_text.set_align('top', 'right')
 
+        # Performance overlay
+        self.hud = Hud(self)
 
         # Select
-        self.select_slide = Slide(parent=self, name='SELECTION', texture=pi3d.Texture(numpy.ones((1,1,3), dtype='uint8')), width=self.width, height=self.height, init_z=-100)
+        self.selection_outline = SelectionOutline()
+        # frames drawn (slides keep the frame they were last drawn in)
+        self.frame_count = 0
         self.selected = None
         self.stroke_selected = 1
 
         # fps
-        self.show_fps = show_fps
+        self.show_fps = False
         self.fps = fps or 60
         self.measured_fps = self.fps
 
-        # Z-sorted slides
-        self.sorted_slides = []
-        self.slides_need_sorting = False
-        self._sort_slides()
+        # frame pacing
+        self.pacer = FramePacer(self.fps, pacing)
+        self.pacing = self.pacer.mode
+        self.frame_interval = [0.0, 0.0, 0.0]
+
+        # offline rendering (fixed-step clock)
+        self.offline = None
+        if offline:
+            self.offline = OfflineRenderer(self.fps, offline_script, offline_output, offline_duration)
+            self.time_origin = self.time = 0
+            # don't let processing time change the frame at which messages are applied
+            self.osc_time_budget = 0
+            self.osc_message_budget = 0
+            # only script messages are applied
+            self.osc_input = False
+            LOGGER.info('offline rendering: live osc input disabled')
+
+        # off-screen / transparent slides culling
+        self.culling = 0
+        self.culling_video = 0
+        self.culled_slides = 0
+        self.culled = 0
+
+        # frame profiler
+        self.profiler = FrameProfiler()
+        self.frame_stats = []
+        self.slide_stats = []
+        self.profile = 0
+
+        # idle frames skipping
+        self.idle_skip = 0
+        self.skipped_frames = 0
+        self.need_redraw = True
 
         # GC
-        self.need_gc = False
+        self.collector = GarbageCollector(gc_policy)
+        self.gc_policy = self.collector.policy
+        self.gc_pause = [0.0, 0.0, 0.0, 0]
 
         # Memory
         self.do_memtest = memtest
@@ -109,6 +190,7 @@ class PytaVSL(Scenes, OscServer):
 
         # Video recorder
         self.recorder = Recorder(self)
+        self.screenshot_path = None
 
         # Audio backend flag
         self.audio_server = None
@@ -143,9 +225,22 @@ class PytaVSL(Scenes, OscServer):
                     self.audio_server = None
                     LOGGER.warning('could not boot audio server (videos will play without audio)')
 
+        self.set_render_scale(render_scale)
+
         # Status
         self.status = 'ready'
         self.loading_count = 0
+        self.loading_lock = Lock()
+
+        self.set_show_fps(show_fps)
+
+        # Metrics endpoint
+        self.metrics_server = None
+        if metrics:
+            try:
+                self.metrics_server = MetricsServer(self, metrics)
+            except Exception as e:
+                LOGGER.error('could not start metrics server on %s (%s)' % (metrics, e))
 
         # Signal
         signal(SIGINT, self.stop)
@@ -154,7 +249,8 @@ class PytaVSL(Scenes, OscServer):
     def memtest(self):
         self.fps = 50
         self.measured_fps = self.fps
-        self.show_fps = False
+        self.pacer.set_fps(self.fps)
+        self.set_show_fps(0)
         self.debug_text.set_text('MEMTEST...')
         self.debug_text.set_visible(1)
         print('Testing video memory size...')
@@ -163,8 +259,8 @@ class PytaVSL(Scenes, OscServer):
             while opengles.glGetError() == GL_NO_ERROR and self.measured_fps > 25:
                 i +=1
                 slide = Slide(parent=self, name='memtest_' + str(i), texture=pi3d.Texture(numpy.zeros((1920,1080,4), dtype='uint8')), width=800, height=600)
-                self.add_slide(slide)
-                slide.set_visible(1)
+                self.defer(self.add_slide, slide)
+                self.defer(slide.set_visible, 1)
                 sleep(1./self.fps*4)
                 print('Testing video memory size...%iMB' % int(self.monitor.allocated / 1000000.))
 
@@ -201,27 +297,58 @@ class PytaVSL(Scenes, OscServer):
 
         # Init framerate measurement
         nframes = 0
-        elapsed = 0
-        start = time()
-        elapsed = 0
+        start = self.pacer.now()
 
         if self.do_memtest:
             self.memtest()
 
-        while self.DISPLAY.loop_running():
+        if self.offline:
+            random.seed(0)
+            if self.offline.output:
+                self.recorder.start(self.offline.output)
+            LOGGER.info('offline rendering: %i frames at %i fps' % (self.offline.nframes, self.fps))
+            render_start = self.pacer.now()
+
+        # Frame started (screen cleared) but not drawn yet
+        frame_pending = False
+
+        profiler = self.profiler
+
+        while True:
 
-            # wait last frame end
-            now = time()
-            delta = 1. / self.fps - (now - self.time)
-            if delta > 0:
-                sleep(delta)
+            profile = profiler.enabled
+            if profile:
+                t = perf_counter()
+
+            if not frame_pending:
+                # show last frame and start a new one
+                if not self.DISPLAY.loop_running():
+                    break
+                frame_pending = True
+            elif not self.DISPLAY.is_running:
+                break
+
+            if profile:
+                t = profiler.lap('swap', t)
+
+            if self.offline:
+                # don't wait
+                frame_time = self.offline.next_frame()
+            else:
+                # wait next frame deadline
+                frame_time = self.pacer.wait()
+
+            if profile:
+                t = profiler.lap('wait', t)
 
             # Update clock
-            if self.recorder.recording:
+            if self.offline:
+                self.time = frame_time
+            elif self.recorder.recording:
                 # don't skip frames when recording
                 self.time += 1. / self.fps
             else:
-                self.time = time()
+                self.time = frame_time
 
 
             if self.DISPLAY.was_resized:
@@ -230,70 +357,181 @@ class PytaVSL(Scenes, OscServer):
                 self.DISPLAY.height = self.height
                 opengles.glViewport(0, 0, self.width, self.height)
                 self.DISPLAY.was_resized = False
+                self.need_redraw = True
 
             # Process osc messages
-            while self.server and self.server.recv(0):
-                pass
+            self.process_osc()
+
+            if self.offline:
+                self.offline_step()
 
+            if profile:
+                t = profiler.lap('osc', t)
 
-            # Draw slides
+            # Draw slides, or keep last frame on screen if nothing changed
+            if self.idle_skip and self.get_is_idle():
+                self.skipped_frames += 1
+            else:
+                self.draw_frame()
+                frame_pending = False
 
-            post_processing = self.post_process.visible
+            if profile:
+                t = profiler.lap('draw', t)
 
-            self.camera.update()
+            # Measure framerate
+            now = self.pacer.now()
+            if now - start > 1.0:
+                self.measured_fps = nframes
+                self.frame_interval = self.pacer.get_stats()
+                self.gc_pause = self.collector.get_stats()
+                if self.quality_governor and not self.offline:
+                    if self.governor.update(self.measured_fps, self.fps):
+                        self.quality = self.governor.get_state() or ['full']
+                if self.profile:
+                    self.frame_stats = profiler.get_stats()
+                    self.slide_stats = profiler.get_slide_stats()
+                if self.show_fps:
+                    self.hud.update()
+                start = now
+                nframes = 0
+                # redraw at least once per second to keep handling window events
+                self.need_redraw = True
 
-            if post_processing:
-                self.post_process.capture_start()
-                self.post_process_bg.draw()
+            nframes += 1
 
-            if self.slides_need_sorting:
-                self._sort_slides()
+            # nodes with subscribers only
+            for node in list(SUBSCRIBED_NODES):
+                node.osc_feed_subscribers()
 
-            for slide in self.sorted_slides:
+            # GC
+            self.collector.collect(self.pacer.slack())
+
+            if profile:
+                profiler.lap('gc', t)
+                profiler.end_frame()
+
+            if self.offline and self.offline.done():
+                elapsed = self.pacer.now() - render_start
+                LOGGER.info('offline rendering: %i frames rendered in %.2fs (%.1f fps)' % (self.offline.nframes, elapsed, self.offline.nframes / max(elapsed, 0.001)))
+                self.stop()
+                break
+
+    def offline_step(self):
+        """
+        Apply script messages due for current frame and wait for loadings to complete
+        """
+        for address, args in self.offline.pop_messages():
+            self.route_osc(address, args)
 
-                if slide.video:
-                    slide.video_pre_draw()
+        while self.loading_count > 0:
+            sleep(0.001)
+            self.process_osc()
 
-                if not slide.parent_slide:
+    def draw_frame(self):
+        """
+        Draw all visible slides
+        """
+        self.need_redraw = False
+        self.frame_count += 1
+
+        profiler = self.profiler
+
+        self.culled_slides = 0
+
+        post_processing = self.post_process.visible
+        render_scaled = self.render_scale != 1.0 or self.outputs
+
+        self.camera.update()
+
+        # video, gif, animations, text glitches
+        self.media_scheduler.tick()
+        self.active_media = self.media_scheduler.active
+
+        if render_scaled:
+            self.render_target.capture_start()
+
+        if post_processing:
+            self.post_process.capture_start()
+            self.post_process_bg.draw()
+
+        for slide in list(self.visible_slides):
+
+            if not slide.parent_slide:
+                if profiler.slides:
+                    t = perf_counter()
+                    slide.draw()
+                    profiler.add_slide(slide.name, t)
+                else:
                     slide.draw()
 
-                slide.osc_feed_subscribers()
+        if post_processing:
+            if profiler.enabled:
+                t = perf_counter()
+            self.post_process.capture_end()
+            self.post_process.draw()
+            if profiler.enabled:
+                profiler.lap('post_process', t)
+
+        if self.selected and self.stroke_selected:
+            self.draw_select_slide()
+
+        if render_scaled:
+            self.render_target.capture_end()
+            if self.outputs:
+                for output in sorted(self.outputs.values(), key=lambda o: -o.pos_z):
+                    output.draw()
+            else:
+                self.render_target.draw()
 
-            if post_processing:
-                self.post_process.capture_end()
-                self.post_process.draw()
+        if profiler.enabled:
+            t = perf_counter()
 
-            self.post_process.osc_feed_subscribers()
-            self.osc_feed_subscribers()
+        # Save frame to video
+        if self.recorder.recording:
+            self.recorder.write()
 
-            if self.selected and self.stroke_selected:
-                self.draw_select_slide()
+        # Save frame to image
+        if self.screenshot_path:
+            self.save_screenshot()
 
-            # Measure framerate
-            if time() - start > 1.0:
-                self.measured_fps = nframes
-                start = time()
-                nframes = 0
+        if profiler.enabled:
+            profiler.lap('recorder', t)
 
-            nframes += 1
+        self.culled = self.culled_slides
+
+        # Debug text always on top
+        self.debug_text.draw()
+        self.hud.draw()
+
+    def get_is_idle(self):
+        """
+        Return True if nothing on stage changed since last frame
+        """
+        if self.need_redraw or self.recorder.recording or self.screenshot_path:
+            return False
 
-            if self.show_fps:
-                self.debug_text.set_visible(1)
-                self.debug_text.set_text('fps: %i' % self.measured_fps)
+        if self.camera.get_is_animated():
+            return False
 
+        if self.post_process.visible and self.post_process.get_is_animated():
+            return False
 
-            # Save frame to video
-            if self.recorder.recording:
-                self.recorder.write()
+        if self.debug_text.visible and self.debug_text.get_is_animated():
+            return False
 
-            # Debug text always on top
-            self.debug_text.draw()
+        for output in self.outputs.values():
+            if output.visible and output.get_is_animated():
+                return False
 
-            # GC
-            if self.need_gc:
-                gc.collect()
-                self.need_gc = False
+        # hidden masks are not in visible_slides but still change what's on stage
+        if self.media_scheduler.get_is_active():
+            return False
 
+        for slide in self.visible_slides:
+            if slide.get_is_animated():
+                return False
+
+        return True
 
     def stop(self, *args):
         """
@@ -303,6 +541,8 @@ class PytaVSL(Scenes, OscServer):
             self.recorder.stop()
         if self.audio_server:
             self.audio_server.stop()
+        if self.metrics_server:
+            self.metrics_server.stop()
         self.DISPLAY.stop()
         self.DISPLAY.destroy()
         super(PytaVSL, self).stop()
@@ -330,39 +570,70 @@ class PytaVSL(Scenes, OscServer):
 
         def threaded():
 
-            with self.loading():
+            # debug text is updated by the render thread
+            self.defer(self.debug_text.set_visible, 1)
+            self.defer(self.debug_text.set_text, '0/' + str(size))
 
-                self.debug_text.set_visible(1)
-                self.debug_text.set_text('0/' + str(size))
+            # slides are inserted by the render thread
+            added = None
+            count = len(self.slides)
 
-                for i in range(size):
-                    try:
-                        path = paths[i]
-                        name = path.split('/')[-1].split('.')[0].lower()
-                        slide = Slide(parent=self, name=name, texture=path, init_z=len(self.slides) / 1000.)
-                        self.add_slide(slide)
-                    except Exception as e:
-                        LOGGER.error('could not load file %s' % path)
-                        print(traceback.format_exc())
-                    self.debug_text.set_text(str(i + 1) + '/' + str(size))
+            for i in range(size):
+                try:
+                    path = paths[i]
+                    name = path.split('/')[-1].split('.')[0].lower()
+                    slide = Slide(parent=self, name=name, texture=path, init_z=count / 1000.)
+                    added = self.defer(self.add_slide, slide)
+                    count += 1
+                except Exception as e:
+                    LOGGER.error('could not load file %s' % path)
+                    print(traceback.format_exc())
+                self.defer(self.debug_text.set_text, str(i + 1) + '/' + str(size))
 
-                self.debug_text.set_visible(0)
+            if added is not None:
+                added.wait()
 
-                LOGGER.info("total slides in memory: %i" % len(self.slides.values()))
+            self.defer(self.debug_text.set_visible, 0)
 
-        t = Thread(target=threaded)
-        t.daemon = True
-        t.start()
+            LOGGER.info("total slides in memory: %i" % len(self.slides.values()))
+
+        self.loading_thread(threaded)
+
+    def sort_slides(self, slide):
+        """
+        Move slide to its drawing position (z-index changed)
+        """
+        self.sorted_slides.update(slide)
+        self.visible_slides.update(slide)
+
+    def add_sorted_slide(self, slide, layer=0):
+        """
+        Insert slide or text in drawing order
+            layer: at equal z-index, lower layers are drawn first (slides: 0, texts: 1)
+        """
+        self.z_rank_count += 1
+        slide.z_rank = (layer, self.z_rank_count)
+        self.sorted_slides.add(slide)
+        self.update_visible_slides(slide)
 
-    def sort_slides(self):
+    def update_visible_slides(self, slide):
         """
-        Sort slides in drawing order (by z-index)
+        Update drawable slides index (slide's visibility or group membership changed)
         """
-        self.slides_need_sorting = True
+        self.need_redraw = True
 
-    def _sort_slides(self):
-        self.sorted_slides = sorted(list(self.slides.values()) + list(self.texts.values()), key=lambda slide: slide.pos_z, reverse=True)
-        self.slides_need_sorting = False
+        slide.update_is_visible()
+
+        if slide not in self.sorted_slides:
+            return
+
+        if slide.is_visible:
+            self.visible_slides.add(slide)
+        elif slide in self.visible_slides:
+            self.visible_slides.remove(slide)
+
+        for child in slide.children:
+            self.update_visible_slides(child)
 
     def flush(self, added_slide=None):
         """
@@ -389,18 +660,21 @@ class PytaVSL(Scenes, OscServer):
             LOGGER.error('could not add slide "%s" (name taken)' % slide.name)
             return
         self.slides[slide.name] = slide
-        self.sort_slides()
+        self.add_sorted_slide(slide)
 
     def remove_slide(self, slide):
         if slide.children:
-            for child in slide.children:
+            for child in list(slide.children):
                 child.quit_group()
         slide.quit_group()
         slide.set_visible(0)
+        slide.set_effect_mask('')
         slide.unload()
+        slide.osc_unsubscribe_all()
         del self.slides[slide.name]
-        self.sort_slides()
-        self.need_gc = True
+        self.sorted_slides.remove(slide)
+        self.visible_slides.discard(slide)
+        self.collector.release()
 
     @osc_method('create_text')
     def create_text(self, name, font):
@@ -418,7 +692,7 @@ class PytaVSL(Scenes, OscServer):
             LOGGER.error('could not add text "%s" (font "%s" not found)' % (name, font))
             return
         self.texts[name] = Text(self, name, font=FONTS[font], init_z=-100 + len(self.texts))
-        self.sort_slides()
+        self.add_sorted_slide(self.texts[name], layer=1)
 
     @osc_method('group')
     def create_group(self, slides, group_name):
@@ -445,6 +719,7 @@ class PytaVSL(Scenes, OscServer):
             group_z = max(map(lambda s: s.pos_z, children)) if len(children) else 0
             group = Slide(parent=self, name=name, texture=EMPTY_TEXTURE, width=self.width, height=self.height, init_z=group_z)
             group.is_group = True
+            group.draw_plan = None
 
             for child in children:
 
@@ -552,26 +827,38 @@ class PytaVSL(Scenes, OscServer):
     def draw_select_slide(self):
         slide = self.get_children(self.slides, self.selected)
         if len(slide) > 0:
-            slide = slide[0]
-            state = slide.state_get()
-            if 'animations' in state:
-                del state['animations']
-            if 'strobes' in state:
-                del state['strobes']
-            # self.select_slide.width = slide.width
-            # self.select_slide.height = slide.height
-            self.select_slide.state_set(state)
-            self.select_slide.set_alpha(1)
-            self.select_slide.set_visible(1)
-            self.select_slide.set_color(0.0, 1.0, 0.0)
-            self.select_slide.set_effect_blur(0.4)
-            self.select_slide.set_position_z(-self.select_slide.pos_z - 1)
-            self.select_slide.set_mesh_wireframe(1)
-            self.select_slide.set_mesh_size(4, 4)
-            self.select_slide.draw()
+            self.selection_outline.draw(slide[0])
         else:
             LOGGER.error('selected slide "%s" does not exist anymore' % self.selected)
-            self.selected = None
+            self.set_selected_slide(None)
+
+    @osc_method('output_create')
+    def create_output(self, name):
+        """
+        Create an output region displaying (a part of) the stage.
+        When at least one output exists, the stage is no longer drawn directly.
+            name: output name
+        """
+        name = str(name).lower()
+        if name in self.outputs:
+            LOGGER.error('could not create output "%s" (name taken)' % name)
+            return
+
+        output = Output(self, name, self.render_target.buf[0].textures[0])
+        output.set_visible(1)
+        self.outputs[name] = output
+        self.need_redraw = True
+
+    @osc_method('output_remove')
+    def remove_output(self, name):
+        """
+        Remove output region(s)
+            name: output name or glob pattern
+        """
+        for output in self.get_children(self.outputs, name):
+            output.osc_unsubscribe_all()
+            del self.outputs[output.name]
+        self.need_redraw = True
 
     @osc_method('record')
     def record(self, path):
@@ -588,6 +875,34 @@ class PytaVSL(Scenes, OscServer):
         """
         self.recorder.stop()
 
+    @osc_method('screenshot')
+    def screenshot(self, path):
+        """
+        Save next frame to image file
+            path: image path (format deduced from the extension)
+        """
+        self.screenshot_path = path
+        self.need_redraw = True
+
+    @osc_method('trace')
+    def trace(self, duration, path='trace.json'):
+        """
+        Record frame timeline for a few seconds and save it as a trace-event file (chrome://tracing, perfetto)
+            duration: capture duration in seconds
+            path: trace file path (json)
+        """
+        self.profiler.start_trace(float(duration), path)
+
+    def save_screenshot(self):
+
+        try:
+            screenshot(self.screenshot_path)
+            LOGGER.info('saved screenshot to %s' % self.screenshot_path)
+        except Exception as e:
+            LOGGER.error('could not save screenshot to %s (%s)' % (self.screenshot_path, e))
+
+        self.screenshot_path = None
+
     @osc_property('status', 'status')
     def set_status_ro(self):
         """
@@ -597,19 +912,241 @@ class PytaVSL(Scenes, OscServer):
         """
         pass
 
+    @osc_property('show_fps', 'show_fps')
+    def set_show_fps(self, show):
+        """
+        Performance overlay: fps, frame times (1 bar per frame, half height = target frame duration),
+        gpu memory, osc backlog and status (0|1)
+        """
+        self.show_fps = int(bool(show))
+        self.hud.set_visible(self.show_fps)
+        if self.show_fps:
+            self.hud.update()
+
+    @osc_property('fps', 'measured_fps')
+    def set_fps_ro(self):
+        """
+        Measured framerate (read-only)
+        """
+        pass
+
+    @osc_property('frame_interval', 'frame_interval')
+    def set_frame_interval_ro(self):
+        """
+        Frame interval statistics over the last frames in ms (read-only): min, average, 99th percentile
+        """
+        pass
+
+    @osc_property('pacing', 'pacing')
+    def set_pacing(self, mode):
+        """
+        Frame pacing mode (sleep|hybrid)
+            - "sleep": sleep until next frame deadline
+            - "hybrid": sleep, then spin-wait the last 2ms for accurate frame timing (cpu expensive)
+        """
+        self.pacer.set_mode(str(mode).lower())
+        self.pacing = self.pacer.mode
+
+    @osc_property('gc_policy', 'gc_policy')
+    def set_gc_policy(self, policy):
+        """
+        Garbage collection policy (auto|show)
+            auto: python's automatic collection
+            show: freeze objects after loading, run full collections in the frames' slack time only
+        """
+        self.collector.set_policy(str(policy).lower())
+        self.gc_policy = self.collector.policy
+
+    @osc_property('gc_pause', 'gc_pause')
+    def set_gc_pause_ro(self):
+        """
+        Garbage collection pauses: last (ms), max (ms), last full collection (ms), count (read-only)
+        """
+        pass
+
+    def apply_quality(self, step):
+        """
+        Apply quality governor step change to existing slides
+        """
+        if step == 'mesh':
+            for slide in self.sorted_slides:
+                slide.set_mesh_size_max(self.quality_mesh_max)
+        elif step == 'group_resolution':
+            for slide in self.sorted_slides:
+                if isinstance(slide, Slide) and slide.post_process:
+                    slide.post_process.set_resolution(self.get_group_resolution())
+
+        self.need_redraw = True
+
+    def get_group_resolution(self):
+        """
+        Resolution of groups' post-processing, relative to the output
+        """
+        return self.render_scale * self.quality_group_scale
+
+    @osc_property('render_scale', 'render_scale')
+    def set_render_scale(self, scale):
+        """
+        Render at a fraction of the output resolution and upscale the result (0.1<>1)
+        """
+        self.render_scale = min(max(float(scale), 0.1), 1.0)
+        self.render_target.set_resolution(self.render_scale)
+        self.post_process.set_resolution(self.render_scale)
+        self.apply_quality('group_resolution')
+
+    @osc_property('quality_governor', 'quality_governor')
+    def set_quality_governor(self, enabled):
+        """
+        Step costly features down when the framerate drops below target (0|1)
+        """
+        self.quality_governor = int(bool(enabled))
+        if not self.quality_governor:
+            self.governor.reset()
+            self.quality = ['full']
+
+    @osc_property('quality_order', 'quality_order')
+    def set_quality_order(self, step1, step2=None, step3=None, step4=None):
+        """
+        Quality governor steps, in degradation order (blur, mesh, group_resolution, video_rate)
+        """
+        self.governor.set_order([str(x).lower() for x in [step1, step2, step3, step4] if x is not None])
+        self.quality_order = self.governor.order
+        self.quality = ['full']
+
+    @osc_property('quality', 'quality')
+    def set_quality_ro(self):
+        """
+        Quality governor steps currently active, "full" if none (read-only)
+        """
+        pass
+
+    @osc_property('profile', 'profile')
+    def set_profile(self, profile):
+        """
+        Frame profiler (0: off, 1: frame phases, 2: frame phases and slides)
+        """
+        self.profile = min(max(int(profile), 0), 2)
+        self.profiler.set_enabled(self.profile > 0, self.profile == 2)
+        self.frame_stats = []
+        self.slide_stats = []
+
+    @osc_property('frame_stats', 'frame_stats')
+    def set_frame_stats_ro(self):
+        """
+        Frame phases timings, updated every second when profiling (read-only)
+            for each phase: name, average (ms), max (ms)
+            phases: wait, osc, animations, video, text, draw, post_process, recorder, swap (includes gpu sync), gc
+        """
+        pass
+
+    @osc_property('slide_stats', 'slide_stats')
+    def set_slide_stats_ro(self):
+        """
+        Most expensive slides, updated every second when profiling slides (read-only)
+            for each slide: name, average (ms), max (ms)
+        """
+        pass
+
+    @osc_property('culling', 'culling')
+    def set_culling(self, culling):
+        """
+        Skip drawing of slides that are fully transparent or outside the viewport (0|1)
+        """
+        self.culling = int(bool(culling))
+        self.culled = 0
+
+    @osc_property('culling_video', 'culling_video')
+    def set_culling_video(self, pause):
+        """
+        Pause video decoding of culled slides (0|1)
+        """
+        self.culling_video = int(bool(pause))
+
+    @osc_property('active_media', 'active_media')
+    def set_active_media_ro(self):
+        """
+        Number of time-based items (animations, videos, gifs, text glitches) updated in last frame (read-only)
+        """
+        pass
+
+    @osc_property('culled', 'culled')
+    def set_culled_ro(self):
+        """
+        Number of slides culled in last frame (read-only)
+        """
+        pass
+
+    @osc_property('idle_skip', 'idle_skip')
+    def set_idle_skip(self, skip):
+        """
+        Skip redrawing frames when nothing changed on stage (0|1)
+        """
+        self.idle_skip = int(bool(skip))
+        self.need_redraw = True
+
+    @osc_property('skipped_frames', 'skipped_frames')
+    def set_skipped_frames_ro(self):
+        """
+        Number of frames skipped by idle_skip (read-only)
+        """
+        pass
+
     @contextmanager
     def loading(self):
         """
         Context for methods that should increment the engine's loading state
         """
         try:
-            self.loading_count += 1
-            if self.loading_count == 1:
-                self.status = 'loading'
-                self.osc_feed_subscribers_property('status')
+            self.loading_begin()
             yield True
         finally:
+            self.loading_end()
+
+    def loading_begin(self):
+        """
+        Enter loading state (may be called from loading threads)
+        """
+        with self.loading_lock:
+            self.loading_count += 1
+            changed = self.loading_count == 1
+
+        if changed:
+            self.defer(self.set_loading_status, 'loading')
+
+    def loading_end(self):
+        """
+        Leave loading state (may be called from loading threads)
+        """
+        with self.loading_lock:
             self.loading_count -= 1
-            if self.loading_count == 0:
-                self.status = 'ready'
-                self.osc_feed_subscribers_property('status')
+            changed = self.loading_count == 0
+
+        if changed:
+            self.defer(self.set_loading_status, 'ready')
+
+    def set_loading_status(self, status):
+        """
+        Apply loading state change (render thread)
+        """
+        self.status = status
+        self.osc_feed_subscribers_property('status')
+        if status == 'ready' and self.loading_count == 0:
+            self.collector.freeze()
+
+    def loading_thread(self, target):
+        """
+        Run target in a separate thread, within the loading state.
+        Loading state is entered before the thread starts so that
+        a frame can't be rendered (offline) before loading begins.
+        """
+        self.loading_begin()
+
+        def threaded():
+            try:
+                target()
+            finally:
+                self.loading_end()
+
+        t = Thread(target=threaded)
+        t.daemon = True
+        t.start()
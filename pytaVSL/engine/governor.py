@@ -0,0 +1,116 @@
+# encoding: utf-8
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+# degradation steps and the engine attribute they set when active (value when inactive, value when active)
+QUALITY_STEPS = {
+    'blur': ('quality_blur', 1.0, 0.5),
+    'mesh': ('quality_mesh_max', 0, 4),
+    'group_resolution': ('quality_group_scale', 1.0, 0.5),
+    'video_rate': ('quality_video_rate', 1.0, 0.5),
+}
+
+QUALITY_ORDER = ['blur', 'mesh', 'group_resolution', 'video_rate']
+
+class QualityGovernor(object):
+    """
+    Steps costly features down when the measured framerate drops below target,
+    and restores them (in reverse order) when there is headroom again.
+    Updated once per second with the measured framerate.
+    """
+
+    def __init__(self, engine, order=QUALITY_ORDER, low=0.9, high=0.98, down_delay=2, up_delay=5):
+
+        self.engine = engine
+        self.order = []
+        self.set_order(order)
+
+        # thresholds (ratio of target fps)
+        self.low = low
+        self.high = high
+
+        # consecutive measurements required before stepping down / up
+        self.down_delay = down_delay
+        self.up_delay = up_delay
+        self.down_count = 0
+        self.up_count = 0
+
+        # number of active steps
+        self.level = 0
+
+        for name in QUALITY_STEPS:
+            attribute, value, degraded = QUALITY_STEPS[name]
+            setattr(self.engine, attribute, value)
+
+    def set_order(self, order):
+        """
+        Set degradation order (subset of QUALITY_ORDER)
+        """
+        new_order = []
+        for name in order:
+            if name not in QUALITY_STEPS:
+                LOGGER.error('unknown quality step "%s" (available: %s)' % (name, ', '.join(QUALITY_ORDER)))
+            elif name not in new_order:
+                new_order.append(name)
+
+        if getattr(self, 'level', 0):
+            self.reset()
+
+        self.order = new_order
+
+    def get_state(self):
+        """
+        Return names of active steps
+        """
+        return self.order[:self.level]
+
+    def update(self, fps, target):
+        """
+        Step quality up or down according to measured framerate
+        """
+        if fps < target * self.low:
+            self.up_count = 0
+            self.down_count += 1
+            if self.down_count >= self.down_delay and self.level < len(self.order):
+                self.down_count = 0
+                self.apply(self.order[self.level], True)
+                self.level += 1
+                return True
+
+        elif fps >= target * self.high:
+            self.down_count = 0
+            self.up_count += 1
+            if self.up_count >= self.up_delay and self.level > 0:
+                self.up_count = 0
+                self.level -= 1
+                self.apply(self.order[self.level], False)
+                return True
+
+        else:
+            self.down_count = 0
+            self.up_count = 0
+
+        return False
+
+    def reset(self):
+        """
+        Restore all steps
+        """
+        while self.level > 0:
+            self.level -= 1
+            self.apply(self.order[self.level], False)
+        self.down_count = 0
+        self.up_count = 0
+
+    def apply(self, name, degraded):
+
+        attribute, value, degraded_value = QUALITY_STEPS[name]
+        setattr(self.engine, attribute, degraded_value if degraded else value)
+
+        self.engine.apply_quality(name)
+
+        if degraded:
+            LOGGER.warning('framerate too low, quality step "%s" enabled' % name)
+        else:
+            LOGGER.info('quality step "%s" disabled' % name)
@@ -0,0 +1,226 @@
+# encoding: utf-8
+
+import os
+import threading
+from ctypes import byref, cast, c_char_p, POINTER
+
+from pi3d.Display import Display, DEFAULT_NEAR, DEFAULT_FAR, DEFAULT_FOV, DEFAULT_SAMPLES
+from pi3d.util.DisplayOpenGL import DisplayOpenGL
+from pi3d.constants import (openegl, opengles, GLfloat, GLint, GLuint, GLboolean, GLsizei, EGLint, EGLConfig,
+    EGLDisplay, EGLSurface, EGLContext,
+    EGL_DEFAULT_DISPLAY, EGL_NO_CONTEXT, EGL_NO_SURFACE, EGL_NONE,
+    EGL_RED_SIZE, EGL_GREEN_SIZE, EGL_BLUE_SIZE, EGL_ALPHA_SIZE, EGL_DEPTH_SIZE, EGL_STENCIL_SIZE,
+    EGL_SAMPLES, EGL_SURFACE_TYPE, EGL_PBUFFER_BIT, EGL_RENDERABLE_TYPE, EGL_OPENGL_ES2_BIT,
+    EGL_CONTEXT_CLIENT_VERSION, EGL_WIDTH, EGL_HEIGHT,
+    GL_FRAMEBUFFER, GL_CULL_FACE, GL_BACK, GL_CW, GL_DEPTH_TEST, GL_PROGRAM_POINT_SIZE, GL_POINT_SPRITE,
+    GL_LESS, GL_GENERATE_MIPMAP_HINT, GL_NICEST, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_VERSION)
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+def set_pbuffer_function_args():
+    """
+    Declare prototypes of the EGL functions pi3d doesn't declare
+    (handles would otherwise be truncated to 32 bit ints)
+    """
+    openegl.eglGetDisplay.restype = EGLDisplay
+
+    openegl.eglInitialize.argtypes = [EGLDisplay, POINTER(EGLint), POINTER(EGLint)]
+    openegl.eglInitialize.restype = EGLint
+
+    openegl.eglCreateContext.argtypes = [EGLDisplay, EGLConfig, EGLContext, POINTER(EGLint)]
+    openegl.eglCreateContext.restype = EGLContext
+
+    openegl.eglCreatePbufferSurface.argtypes = [EGLDisplay, EGLConfig, POINTER(EGLint)]
+    openegl.eglCreatePbufferSurface.restype = EGLSurface
+
+    openegl.eglMakeCurrent.argtypes = [EGLDisplay, EGLSurface, EGLSurface, EGLContext]
+    openegl.eglMakeCurrent.restype = EGLint
+
+    openegl.eglDestroySurface.argtypes = [EGLDisplay, EGLSurface]
+    openegl.eglDestroyContext.argtypes = [EGLDisplay, EGLContext]
+    openegl.eglTerminate.argtypes = [EGLDisplay]
+
+class HeadlessOpenGL(DisplayOpenGL):
+    """
+    EGL context rendering to an offscreen pbuffer surface (no window, no display server)
+    """
+
+    def __init__(self, width, height):
+
+        # don't call DisplayOpenGL.__init__: it connects to the X server
+        self.d = None
+        self.gl_id = 'GL'
+        self.use_glx = False
+        self.active = False
+        self.width = width
+        self.height = height
+
+    def create_display(self, x=0, y=0, w=0, h=0, depth=24, samples=0, **kwargs):
+
+        # let mesa pick a platform that doesn't need a display server
+        os.environ.setdefault('EGL_PLATFORM', 'surfaceless')
+
+        set_pbuffer_function_args()
+
+        # null handles are falsy
+        self.display = openegl.eglGetDisplay(EGL_DEFAULT_DISPLAY)
+        if not self.display:
+            raise RuntimeError('could not get EGL display')
+
+        if not openegl.eglInitialize(self.display, None, None):
+            raise RuntimeError('could not initialize EGL display')
+
+        attribute_list = (EGLint * 19)(EGL_RED_SIZE, 8,
+                                       EGL_GREEN_SIZE, 8,
+                                       EGL_BLUE_SIZE, 8,
+                                       EGL_ALPHA_SIZE, 8,
+                                       EGL_DEPTH_SIZE, depth,
+                                       EGL_STENCIL_SIZE, 8,
+                                       EGL_SAMPLES, samples,
+                                       EGL_SURFACE_TYPE, EGL_PBUFFER_BIT,
+                                       EGL_RENDERABLE_TYPE, EGL_OPENGL_ES2_BIT,
+                                       EGL_NONE)
+        numconfig = EGLint(0)
+        configs = (EGLConfig * 5)(*(EGLConfig() for _ in range(5)))
+        openegl.eglChooseConfig(self.display, attribute_list, configs, EGLint(len(configs)), byref(numconfig))
+        if numconfig.value <= 0:
+            raise RuntimeError('no EGL pbuffer configuration available')
+
+        self.config = configs[0]
+        context_attribs = (EGLint * 3)(EGL_CONTEXT_CLIENT_VERSION, 2, EGL_NONE)
+        self.context = openegl.eglCreateContext(self.display, self.config, EGL_NO_CONTEXT, context_attribs)
+        if not self.context:
+            raise RuntimeError('could not create EGL context')
+
+        self.create_surface(x, y, w, h)
+
+        # same defaults as pi3d's window displays
+        opengles.glDepthRangef(GLfloat(0.0), GLfloat(1.0))
+        opengles.glBindFramebuffer(GL_FRAMEBUFFER, GLuint(0))
+        opengles.glEnable(GL_CULL_FACE)
+        opengles.glCullFace(GL_BACK)
+        opengles.glFrontFace(GL_CW)
+        opengles.glEnable(GL_DEPTH_TEST)
+        opengles.glEnable(GL_PROGRAM_POINT_SIZE)
+        opengles.glEnable(GL_POINT_SPRITE)
+        opengles.glDepthFunc(GL_LESS)
+        opengles.glDepthMask(GLboolean(True))
+        opengles.glHint(GL_GENERATE_MIPMAP_HINT, GL_NICEST)
+        opengles.glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, 1, GL_ONE_MINUS_SRC_ALPHA)
+        opengles.glColorMask(GLboolean(True), GLboolean(True), GLboolean(True), GLboolean(False))
+
+        self.active = True
+
+        # GL v GLES version, used by pi3d to translate shaders (as in DisplayOpenGL.create_display)
+        version = cast(opengles.glGetString(GL_VERSION), c_char_p).value
+        if version and b'ES' in version:
+            for s in version.split():
+                if b'.' in s:
+                    self.gl_id = b'GLES' + s.split(b'.')[0]
+                    break
+
+    def create_surface(self, x=0, y=0, w=0, h=0, layer=0):
+
+        surface_attribs = (EGLint * 5)(EGL_WIDTH, w, EGL_HEIGHT, h, EGL_NONE)
+        self.surface = openegl.eglCreatePbufferSurface(self.display, self.config, surface_attribs)
+        if not self.surface:
+            raise RuntimeError('could not create EGL pbuffer surface')
+
+        if not openegl.eglMakeCurrent(self.display, self.surface, self.surface, self.context):
+            raise RuntimeError('could not make EGL context current')
+
+        self.width, self.height = w, h
+        opengles.glViewport(GLint(0), GLint(0), GLsizei(w), GLsizei(h))
+
+    def resize(self, x=0, y=0, w=0, h=0, layer=0):
+        pass
+
+    def change_layer(self, layer=0):
+        pass
+
+    def destroy(self, display=None):
+
+        if self.active:
+            openegl.eglMakeCurrent(self.display, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT)
+            openegl.eglDestroySurface(self.display, self.surface)
+            openegl.eglDestroyContext(self.display, self.context)
+            openegl.eglTerminate(self.display)
+            self.active = False
+
+    def swap_buffers(self):
+        # nothing to present: wait for the frame to be rendered so that frame times include gpu work
+        opengles.glFinish()
+
+class HeadlessDisplay(Display):
+    """
+    pi3d Display without window nor event handling
+    """
+
+    def __init__(self, width, height):
+
+        # don't call Display.__init__: it creates a window-system backed DisplayOpenGL
+        if Display.INSTANCE is None:
+            Display.INSTANCE = self
+
+        self.tkwin = None
+        self.sprites = []
+        self.sprites_to_load = set()
+        self.sprites_to_unload = set()
+
+        self.tidy_needed = False
+        self.textures_dict = {}
+        self.vbufs_dict = {}
+        self.ebufs_dict = {}
+        self.last_shader = None
+        self.last_textures = [None for _ in range(8)]
+        self.external_mouse = None
+        self.offscreen_tex = False
+        self.event_list = []
+
+        self.opengl = HeadlessOpenGL(width, height)
+        self.max_width, self.max_height = width, height
+        self.first_time = True
+        self.is_running = True
+        self.lock = threading.RLock()
+        self.was_resized = False
+
+    def _loop_begin(self):
+
+        self.clear()
+
+        with self.lock:
+            self.sprites_to_load, to_load = set(), self.sprites_to_load
+            self.sprites.extend(to_load)
+        self._for_each_sprite(lambda s: s.load_opengl(), to_load)
+
+        if self.tidy_needed:
+            self._tidy()
+
+def create_headless_display(w, h, near=None, far=None, depth=24, background=None):
+    """
+    Create an offscreen pi3d Display (same initialization as pi3d.Display.create)
+    """
+    display = HeadlessDisplay(w, h)
+
+    display.frames_per_second = 0
+    display.width = w
+    display.height = h
+    display.near = near if near is not None else DEFAULT_NEAR
+    display.far = far if far is not None else DEFAULT_FAR
+    display.fov = DEFAULT_FOV
+    display.left = 0
+    display.top = 0
+    display.right = w
+    display.bottom = h
+    display.layer = 0
+    display.mouse = None
+
+    display.opengl.create_display(0, 0, w, h, depth=depth, samples=DEFAULT_SAMPLES)
+
+    if background is not None:
+        display.set_background(*background)
+
+    LOGGER.info('headless display created (%ix%i)' % (w, h))
+
+    return display
@@ -0,0 +1,165 @@
+# encoding: utf-8
+
+import os
+import stat
+import resource
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+
+        if self.path.split('?')[0] not in ['/', '/metrics']:
+            self.send_error(404)
+            return
+
+        try:
+            body = self.server.metrics.export().encode('utf-8')
+        except Exception as e:
+            LOGGER.error('could not export metrics (%s)' % e)
+            self.send_error(500)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # unix sockets have no client address
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        LOGGER.debug(format % args)
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+
+    daemon_threads = True
+
+    def get_request(self):
+        request, address = super(ThreadingUnixHTTPServer, self).get_request()
+        return request, ['unix', 0]
+
+class MetricsServer(object):
+    """
+    Prometheus text format endpoint (http on a local port or unix socket).
+    Served from a background thread that only reads counters maintained by the engine.
+    """
+
+    def __init__(self, engine, address):
+
+        self.engine = engine
+        self.server = None
+
+        if str(address).isdigit():
+            self.server = ThreadingHTTPServer(('127.0.0.1', int(address)), MetricsHandler)
+            self.server.daemon_threads = True
+            LOGGER.info('metrics served on http://127.0.0.1:%s/metrics' % address)
+        else:
+            if os.path.exists(address):
+                if not self.is_socket(address):
+                    raise RuntimeError('file exists and is not a socket')
+                # stale socket
+                os.remove(address)
+            self.server = ThreadingUnixHTTPServer(address, MetricsHandler)
+            LOGGER.info('metrics served on unix socket %s' % address)
+
+        self.server.metrics = self
+
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            if isinstance(self.server, UnixStreamServer) and self.is_socket(self.server.server_address):
+                os.remove(self.server.server_address)
+            self.server = None
+
+    def is_socket(self, path):
+
+        try:
+            return stat.S_ISSOCK(os.lstat(path).st_mode)
+        except OSError:
+            return False
+
+    def get_rss(self):
+        """
+        Return resident memory size in bytes
+        """
+        try:
+            with open('/proc/self/statm', 'r') as f:
+                return int(f.read().split()[1]) * resource.getpagesize()
+        except (OSError, IndexError, ValueError):
+            # not linux: peak rss (kilobytes)
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def get_values(self, container):
+        """
+        Copy container's values (may be modified by the render thread while iterating)
+        """
+        for i in range(10):
+            try:
+                return list(container.values() if hasattr(container, 'values') else container)
+            except RuntimeError:
+                pass
+        return []
+
+    def export(self):
+
+        engine = self.engine
+        lines = []
+
+        def metric(name, kind, help, samples):
+            lines.append('# HELP pytavsl_%s %s' % (name, help))
+            lines.append('# TYPE pytavsl_%s %s' % (name, kind))
+            for labels, value in samples:
+                lines.append('pytavsl_%s%s %s' % (name, labels, repr(float(value))))
+
+        # frame intervals
+        intervals = sorted(self.get_values(engine.pacer.intervals))
+        if intervals:
+            count = len(intervals)
+            quantiles = [('{quantile="%s"}' % q, intervals[min(count - 1, int(count * q))]) for q in (0.5, 0.9, 0.99)]
+            metric('frame_interval_seconds', 'summary', 'Frame intervals over the last frames',
+                   quantiles + [('_sum', sum(intervals)), ('_count', count)])
+        metric('fps', 'gauge', 'Measured framerate', [('', engine.measured_fps)])
+        metric('target_fps', 'gauge', 'Target framerate', [('', engine.fps)])
+        metric('skipped_frames_total', 'counter', 'Idle frames not redrawn', [('', engine.skipped_frames)])
+        metric('gc_pause_seconds', 'gauge', 'Longest garbage collection pause over the last 100 collections',
+               [('', engine.gc_pause[1] / 1000.)])
+
+        # gpu memory
+        metric('vram_allocated_bytes', 'gauge', 'Texture memory allocated', [('', engine.monitor.allocated)])
+        metric('vram_max_bytes', 'gauge', 'Texture memory limit', [('', engine.monitor.max)])
+
+        # slides
+        slides = self.get_values(engine.slides)
+        metric('slides', 'gauge', 'Slides', [('', len(slides))])
+        metric('slides_loaded', 'gauge', 'Slides uploaded to the gpu', [('', len([s for s in slides if s.loaded]))])
+        metric('slides_visible', 'gauge', 'Visible slides', [('', len(self.get_values(engine.visible_slides)))])
+        metric('slides_culled', 'gauge', 'Visible slides not drawn in last frame (culling)', [('', engine.culled)])
+
+        # osc
+        metric('osc_processed_total', 'counter', 'Osc messages and deferred calls processed', [('', engine.osc_processed)])
+        metric('osc_backlog', 'gauge', 'Osc messages waiting to be processed', [('', engine.osc_backlog)])
+
+        # video decoding: time not caught up by visible videos
+        lag = 0
+        for slide in slides:
+            if slide.video and slide.video_speed > 0 and slide.is_visible and slide.video_elapsed_time:
+                lag = max(lag, engine.time - slide.video_elapsed_time)
+        metric('video_lag_seconds', 'gauge', 'Largest video decoding lag among visible videos', [('', lag)])
+
+        # process
+        metric('rss_bytes', 'gauge', 'Resident memory size', [('', self.get_rss())])
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,102 @@
+# encoding: utf-8
+
+import shlex
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+def parse_osc_argument(arg):
+    """
+    Convert script argument to int, float or string
+    """
+    for t in (int, float):
+        try:
+            return t(arg)
+        except ValueError:
+            pass
+    return arg
+
+class OscScript(object):
+    """
+    Timestamped osc messages, one per line:
+        <time in seconds> <address> [arguments ...]
+    Empty lines and lines starting with "#" are ignored.
+    """
+
+    def __init__(self, path):
+
+        self.messages = []
+        self.index = 0
+
+        with open(path, 'r') as f:
+            for n, line in enumerate(f):
+                try:
+                    tokens = shlex.split(line, comments=True)
+                except ValueError as e:
+                    LOGGER.error('%s:%i: %s' % (path, n + 1, e))
+                    continue
+                if not tokens:
+                    continue
+                if len(tokens) < 2 or tokens[1][0] != '/':
+                    LOGGER.error('%s:%i: invalid message "%s"' % (path, n + 1, line.strip()))
+                    continue
+                try:
+                    timestamp = float(tokens[0])
+                except ValueError:
+                    LOGGER.error('%s:%i: invalid timestamp "%s"' % (path, n + 1, line.strip()))
+                    continue
+                self.messages.append((timestamp, tokens[1], [parse_osc_argument(x) for x in tokens[2:]]))
+
+        # stable sort: messages with the same timestamp keep their order
+        self.messages.sort(key=lambda m: m[0])
+
+        self.duration = self.messages[-1][0] if self.messages else 0
+
+    def pop(self, time):
+        """
+        Return messages scheduled up to given time (not returned yet)
+        """
+        start = self.index
+        while self.index < len(self.messages) and self.messages[self.index][0] <= time:
+            self.index += 1
+        return [(address, args) for _, address, args in self.messages[start:self.index]]
+
+class OfflineRenderer(object):
+    """
+    Fixed-step clock for offline rendering: frame n is rendered at time n / fps, without waiting.
+    """
+
+    def __init__(self, fps, script=None, output=None, duration=None):
+
+        self.fps = fps
+        self.frame = -1
+        self.script = OscScript(script) if script else None
+        self.output = output
+
+        if duration:
+            self.duration = float(duration)
+        elif self.script:
+            self.duration = self.script.duration + 1. / fps
+        else:
+            self.duration = 0
+
+        self.nframes = max(int(round(self.duration * fps)), 1)
+
+    def next_frame(self):
+        """
+        Advance to next frame and return its time
+        """
+        self.frame += 1
+        return self.frame / self.fps
+
+    def done(self):
+        return self.frame + 1 >= self.nframes
+
+    def pop_messages(self):
+        """
+        Return script messages due for current frame
+        """
+        if self.script is None:
+            return []
+        # messages are applied at the nearest frame
+        return self.script.pop(self.frame / self.fps + 0.5 / self.fps)
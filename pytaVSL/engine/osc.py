@@ -2,10 +2,14 @@
 
 import pyliblo3 as liblo
 import logging
+from functools import wraps
 from inspect import getmembers, getfullargspec
 
 LOGGER = logging.getLogger(__name__)
 
+# nodes with active subscriptions (insertion ordered)
+SUBSCRIBED_NODES = {}
+
 def normalize_osc_port(port):
 
     if str(port).isdigit():
@@ -58,17 +62,29 @@ class osc_property():
 
     def __call__(self, method):
 
-        method.osc_attribute = True
-        method.osc_setter_alias = self.osc_setter_alias
-        method.osc_getter_attributes = self.osc_getter_attributes
-        method.osc_argcount = method.__code__.co_argcount - 1
-        method.osc_argcount_min = method.osc_argcount if not method.__defaults__ else method.osc_argcount - len(method.__defaults__)
-        method.shorthand = self.shorthand
+        alias = self.osc_setter_alias
 
-        return method
+        @wraps(method)
+        def setter(node, *args, **kwargs):
+            result = method(node, *args, **kwargs)
+            if node.osc_subscribes:
+                node.osc_dirty.add(alias)
+            return result
+
+        setter.osc_attribute = True
+        setter.osc_setter_alias = self.osc_setter_alias
+        setter.osc_getter_attributes = self.osc_getter_attributes
+        setter.osc_argcount = method.__code__.co_argcount - 1
+        setter.osc_argcount_min = setter.osc_argcount if not method.__defaults__ else setter.osc_argcount - len(method.__defaults__)
+        setter.shorthand = self.shorthand
+
+        return setter
 
 class OscNode(object):
 
+    # property setters may be called before __init__ is done
+    osc_subscribes = None
+
     def __init__(self, *args, **kwargs):
 
         super(OscNode, self).__init__(*args, **kwargs)
@@ -78,6 +94,8 @@ class OscNode(object):
         self.osc_state = {}
         self.osc_attributes_horthands = []
         self.osc_subscribes = {}
+        # properties set since subscribers were last fed
+        self.osc_dirty = set()
 
         for name, method in getmembers(self):
 
@@ -220,6 +238,8 @@ class OscNode(object):
         if property not in self.osc_subscribes:
             self.osc_subscribes[property] = {}
 
+        SUBSCRIBED_NODES[self] = True
+
         if return_port not in self.osc_subscribes[property]:
             value = self.osc_get_value(property)[:]
             self.osc_subscribes[property][return_port] = value
@@ -255,10 +275,47 @@ class OscNode(object):
             if return_port in self.osc_subscribes[property]:
                 del self.osc_subscribes[property][return_port]
 
+            if not self.osc_subscribes[property]:
+                del self.osc_subscribes[property]
+
+        if not self.osc_subscribes:
+            SUBSCRIBED_NODES.pop(self, None)
+
+    def osc_unsubscribe_all(self):
+        """
+        Remove all subscriptions (node removed)
+        """
+        self.osc_subscribes = {}
+        SUBSCRIBED_NODES.pop(self, None)
+
+    def osc_set_changed(self, *properties):
+        """
+        Mark properties changed by a setter other than their own
+        """
+        if self.osc_subscribes:
+            self.osc_dirty.update(properties)
+
+    def osc_get_is_volatile(self):
+        """
+        Return True if properties may change without their setter being called
+        (read-only properties are always considered volatile)
+        """
+        return False
+
     def osc_feed_subscribers(self):
 
+        volatile = self.osc_get_is_volatile()
+
+        # attributes of the properties set (shorthands share them with their full property)
+        attributes = set()
+        for property in self.osc_dirty:
+            attributes.update(self.osc_attributes[property].osc_getter_attributes)
+        self.osc_dirty.clear()
+
         for property in self.osc_subscribes:
-            self.osc_feed_subscribers_property(property)
+            method = self.osc_attributes[property]
+            if volatile or method.osc_argcount == 0 or not attributes.isdisjoint(method.osc_getter_attributes):
+                self.osc_feed_subscribers_property(property)
 
     def osc_feed_subscribers_property(self, property):
 
@@ -0,0 +1,98 @@
+# encoding: utf-8
+
+from time import time, perf_counter, sleep
+from collections import deque
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+PACING_MODES = ['sleep', 'hybrid']
+
+class FramePacer(object):
+    """
+    Frame pacing on a monotonic clock with an absolute deadline schedule.
+    Modes:
+        - "sleep": sleep until the next deadline
+        - "hybrid": sleep until shortly before the deadline, then spin-wait
+    """
+
+    def __init__(self, fps, mode='sleep', spin=0.002, window=250):
+
+        self.period = 1. / fps
+        self.mode = mode if mode in PACING_MODES else 'sleep'
+        self.spin = spin
+
+        self.deadline = None
+        self.last_frame = None
+        self.intervals = deque(maxlen=window)
+
+        # monotonic clock to wall clock offset
+        self.origin = time() - perf_counter()
+
+    def now(self):
+        """
+        Return current monotonic time
+        """
+        return perf_counter()
+
+    def set_fps(self, fps):
+        self.period = 1. / fps
+
+    def set_mode(self, mode):
+        if mode not in PACING_MODES:
+            LOGGER.error('unknown pacing mode "%s" (available: %s)' % (mode, ', '.join(PACING_MODES)))
+            return
+        self.mode = mode
+
+    def slack(self):
+        """
+        Return time left before next frame deadline
+        """
+        if self.deadline is None:
+            return 0
+        return self.deadline + self.period - perf_counter()
+
+    def wait(self):
+        """
+        Wait until next frame deadline and return its scheduled time (wall clock aligned)
+        Late frames keep the schedule unless they're late by more than one period.
+        """
+        now = perf_counter()
+
+        if self.deadline is None:
+            self.deadline = now
+        else:
+            self.deadline += self.period
+            if now - self.deadline > self.period:
+                # too late: resynchronize instead of catching up
+                self.deadline = now
+
+        remaining = self.deadline - now
+        if remaining > 0:
+            if self.mode == 'hybrid':
+                if remaining > self.spin:
+                    sleep(remaining - self.spin)
+                while perf_counter() < self.deadline:
+                    pass
+            else:
+                sleep(remaining)
+
+        now = perf_counter()
+        if self.last_frame is not None:
+            self.intervals.append(now - self.last_frame)
+        self.last_frame = now
+
+        return self.origin + self.deadline
+
+    def get_stats(self):
+        """
+        Return min, average and 99th percentile frame intervals (ms)
+        """
+        if not self.intervals:
+            return [0.0, 0.0, 0.0]
+
+        intervals = sorted(self.intervals)
+        count = len(intervals)
+        p99 = intervals[min(count - 1, int(count * 0.99))]
+
+        return [intervals[0] * 1000., sum(intervals) / count * 1000., p99 * 1000.]
@@ -0,0 +1,185 @@
+# encoding: utf-8
+
+import re
+from functools import lru_cache
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+# maximum number of cached address patterns (compiled regexps and matches)
+PATTERN_CACHE_SIZE = 256
+
+def osc_to_regexp_transliteration(match):
+    s = match.group(0)
+    s = s.replace("{","(")
+    s = s.replace("}",")")
+    s = s.replace(",","|")
+    return s
+
+osc_to_regexp_re = re.compile(r"\{[^\}]*\}")
+
+osc_to_regexp_patterns = {
+    r"\?": ".",
+    r"\*": ".*",
+    r"\[!([^\]]*)\]": r"[^\1]",
+    r"\$": r"\$",
+    r"\^": r"\^",
+    r"\\": r"\\"
+}
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def osc_to_regexp(address):
+    """
+    Convert OSC 1.1 compliant address to regexp pattern standards
+    Escape ^, $ (start/end of string delimiters) and \ (escape char)
+    ?           -> .?
+    [!a-Z]      -> [^a-Z]
+    {foo,bar}   -> (foo|bar)
+
+    Params:
+    address : str
+
+    Borrowed from pyoChainsaw @ https://framagit.org/groolot-association/pyoChainsaw
+    Copyleft Gregory David & JE Doucet (GNU GPLv3)
+    """
+
+    for pattern, repl in osc_to_regexp_patterns.items():
+        address = re.sub(pattern, repl, address)
+
+    return re.compile("^" + re.sub(osc_to_regexp_re, osc_to_regexp_transliteration, address) + "$")
+
+osc_braces_re = re.compile(r"\{([^\{\}]*)\}")
+
+osc_brackets_re = re.compile(r"\[[^\]]*\]")
+
+# characters that end a pattern's literal prefix (osc wildcards and unescaped regexp characters)
+osc_pattern_chars_re = re.compile(r"[*?\[\]{}.+()|]")
+
+# regexp characters passed through by osc_to_regexp that can change the whole pattern's meaning
+# (escapes, alternation, groups, repetitions): such patterns are matched against all names
+osc_regexp_chars_re = re.compile(r"[\\|+()]")
+
+# maximum number of alternatives a pattern's braces are expanded to
+BRACES_EXPANSION_SIZE = 64
+
+def osc_expand_braces(address):
+    """
+    Expand {foo,bar} alternatives: a{b,c}[0-9] -> [ab[0-9], ac[0-9]]
+    Patterns that would expand to too many alternatives, or with braces
+    inside brackets, are left untouched.
+    """
+    matches = list(osc_braces_re.finditer(address))
+
+    for brackets in osc_brackets_re.finditer(address):
+        for match in matches:
+            if match.start() < brackets.end() and brackets.start() < match.end():
+                return [address]
+
+    count = 1
+    for match in matches:
+        count *= len(match.group(1).split(','))
+    if count > BRACES_EXPANSION_SIZE:
+        return [address]
+
+    expanded = ['']
+    position = 0
+    for match in matches:
+        head = address[position:match.start()]
+        expanded = [e + head + alternative for e in expanded for alternative in match.group(1).split(',')]
+        position = match.end()
+
+    return [e + address[position:] for e in expanded]
+
+class OscStore(dict):
+    """
+    Name -> object dict (slides, texts, outputs) that memoizes address pattern matches.
+    Names are indexed in a sorted list: patterns are matched against names sharing
+    their literal prefix only. Matches are invalidated whenever an item is added or removed.
+    """
+
+    def __init__(self, *args, **kwargs):
+
+        super(OscStore, self).__init__(*args, **kwargs)
+
+        self.matches = OrderedDict()
+
+        # sorted names and insertion order (matches are returned in insertion order)
+        self.names = sorted(self)
+        self.order = {name: i for i, name in enumerate(self)}
+        self.sequence = len(self)
+
+    def __setitem__(self, name, item):
+
+        if name not in self:
+            insort(self.names, name)
+            self.order[name] = self.sequence
+            self.sequence += 1
+
+        super(OscStore, self).__setitem__(name, item)
+        self.matches.clear()
+
+    def __delitem__(self, name):
+
+        super(OscStore, self).__delitem__(name)
+        self.unindex(name)
+
+    def pop(self, name, *args):
+
+        if name in self:
+            self.unindex(name)
+        return super(OscStore, self).pop(name, *args)
+
+    def clear(self):
+
+        super(OscStore, self).clear()
+        self.names = []
+        self.order = {}
+        self.matches.clear()
+
+    def unindex(self, name):
+
+        del self.names[bisect_left(self.names, name)]
+        del self.order[name]
+        self.matches.clear()
+
+    def match(self, pattern):
+        """
+        Return items whose name matches given osc address pattern
+        """
+        if pattern in self.matches:
+            # least recently used patterns are dropped first
+            self.matches.move_to_end(pattern)
+
+        else:
+
+            if len(self.matches) >= PATTERN_CACHE_SIZE:
+                self.matches.popitem(last=False)
+
+            alternatives = []
+            for alternative in osc_expand_braces(pattern):
+                special = osc_pattern_chars_re.search(alternative)
+                alternatives.append((alternative, alternative[:special.start()] if special else None))
+
+            if osc_regexp_chars_re.search(pattern) or any(prefix == '' for alternative, prefix in alternatives):
+                # no literal prefix: scan all names
+                regexp = osc_to_regexp(pattern)
+                self.matches[pattern] = [self[name] for name in self if name and regexp.match(name)]
+
+            else:
+                names = set()
+                for alternative, prefix in alternatives:
+                    if prefix is None:
+                        # plain name
+                        if alternative and alternative in self:
+                            names.add(alternative)
+                    else:
+                        # names starting with prefix
+                        regexp = osc_to_regexp(alternative)
+                        start = bisect_left(self.names, prefix)
+                        end = bisect_left(self.names, prefix + '\U0010ffff', start)
+                        names.update([name for name in self.names[start:end] if regexp.match(name)])
+
+                self.matches[pattern] = [self[name] for name in sorted(names, key=self.order.get)]
+
+        return list(self.matches[pattern])
+
+
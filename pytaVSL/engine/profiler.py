@@ -0,0 +1,188 @@
+# encoding: utf-8
+
+from time import perf_counter
+from collections import deque
+from threading import Thread
+import json
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+# frame phases, in report order
+PHASES = ['wait', 'osc', 'animations', 'video', 'text', 'draw', 'post_process', 'recorder', 'swap', 'gc']
+
+# phases measured while drawing, subtracted from the draw phase
+DRAW_PHASES = ['animations', 'video', 'text', 'post_process', 'recorder']
+
+class FrameProfiler(object):
+    """
+    Per-phase frame timings (rolling windows) and trace capture (chrome trace-event format).
+    Timers must be guarded with "if profiler.enabled" so that they cost nothing when disabled.
+    """
+
+    def __init__(self, window=100):
+
+        # timers active (profiling or tracing)
+        self.enabled = False
+        # per-slide timers active
+        self.slides = False
+
+        self.profiling = False
+        self.profiling_slides = False
+
+        self.window = window
+        self.phases = {name: 0.0 for name in PHASES}
+        self.history = {name: deque(maxlen=window) for name in PHASES}
+        self.slide_history = {}
+
+        # trace capture
+        self.tracing = False
+        self.trace_events = []
+        self.trace_path = None
+        self.trace_end = 0
+        self.trace_origin = 0
+        self.frame_start = 0
+
+    def set_enabled(self, enabled, slides=False):
+
+        self.profiling = enabled
+        self.profiling_slides = enabled and slides
+        if not self.profiling_slides:
+            self.slide_history = {}
+        self.update_enabled()
+
+    def update_enabled(self):
+
+        self.enabled = self.profiling or self.tracing
+        self.slides = self.profiling_slides or self.tracing
+
+    def start_trace(self, duration, path):
+        """
+        Record spans for given duration (in seconds) and write them to path
+        """
+        if self.tracing:
+            LOGGER.error('trace capture already running')
+            return
+
+        self.trace_events = []
+        self.trace_path = path
+        self.trace_origin = perf_counter()
+        self.trace_end = self.trace_origin + duration
+        self.frame_start = self.trace_origin
+        self.tracing = True
+        self.update_enabled()
+
+        LOGGER.info('trace capture started (%.1fs)' % duration)
+
+    def stop_trace(self):
+        """
+        Stop recording and write trace file in a separate thread
+        """
+        self.tracing = False
+        self.update_enabled()
+
+        events, self.trace_events = self.trace_events, []
+
+        Thread(target=self.write_trace, args=(events, self.trace_path, self.trace_origin), daemon=True).start()
+
+    def write_trace(self, events, path, origin):
+
+        trace = {
+            'traceEvents': [
+                {'name': name, 'cat': category, 'ph': 'X', 'pid': 0, 'tid': 0,
+                 'ts': (start - origin) * 1000000., 'dur': (end - start) * 1000000.}
+                for name, category, start, end in events
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+        try:
+            with open(path, 'w') as f:
+                json.dump(trace, f)
+            LOGGER.info('trace saved to %s (%i events)' % (path, len(events)))
+        except Exception as e:
+            LOGGER.error('could not save trace to %s (%s)' % (path, e))
+
+    def span(self, name, category, start, end=None):
+        """
+        Record a span when tracing and return its end time
+        """
+        if end is None:
+            end = perf_counter()
+        if self.tracing:
+            self.trace_events.append((name, category, start, end))
+        return end
+
+    def add(self, phase, duration):
+        """
+        Add duration to current frame's phase
+        """
+        self.phases[phase] += duration
+
+    def lap(self, phase, start, name=None):
+        """
+        Add time elapsed since start to current frame's phase and return current time
+        """
+        now = perf_counter()
+        self.phases[phase] += now - start
+        if self.tracing:
+            self.trace_events.append((name or phase, phase, start, now))
+        return now
+
+    def add_slide(self, name, start):
+        """
+        Add slide's drawing time (since start) to current frame
+        """
+        now = perf_counter()
+        if self.profiling_slides:
+            if name not in self.slide_history:
+                self.slide_history[name] = deque(maxlen=self.window)
+            self.slide_history[name].append(now - start)
+        if self.tracing:
+            self.trace_events.append((name, 'slide', start, now))
+
+    def end_frame(self):
+        """
+        Store current frame's timings
+        """
+        phases = self.phases
+
+        phases['draw'] = max(phases['draw'] - sum([phases[name] for name in DRAW_PHASES]), 0.0)
+
+        for name in PHASES:
+            self.history[name].append(phases[name])
+            phases[name] = 0.0
+
+        if self.tracing:
+            now = perf_counter()
+            self.trace_events.append(('frame', 'frame', self.frame_start, now))
+            self.frame_start = now
+            if now >= self.trace_end:
+                self.stop_trace()
+
+    def get_stats(self):
+        """
+        Return phase, average (ms) and max (ms) for each phase
+        """
+        stats = []
+        for name in PHASES:
+            values = self.history[name]
+            if values:
+                stats += [name, sum(values) / len(values) * 1000., max(values) * 1000.]
+            else:
+                stats += [name, 0.0, 0.0]
+        return stats
+
+    def get_slide_stats(self, count=10):
+        """
+        Return name, average (ms) and max (ms) of the most expensive slides
+        """
+        averages = []
+        for name in self.slide_history:
+            values = self.slide_history[name]
+            averages.append((sum(values) / len(values), max(values), name))
+
+        stats = []
+        for avg, peak, name in sorted(averages, reverse=True)[:count]:
+            stats += [name, avg * 1000., peak * 1000.]
+        return stats
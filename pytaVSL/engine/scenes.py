@@ -184,6 +184,4 @@ class Scenes(object):
                     LOGGER.error('could not load scene file %s' % path)
                     print(traceback.format_exc())
 
-        t = Thread(target=threaded)
-        t.daemon = True
-        t.start()
+        self.loading_thread(threaded)
@@ -0,0 +1,53 @@
+# encoding: utf-8
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+# update order: animations first, they may change the other media's properties
+MEDIA_KINDS = ['animations', 'video', 'gif', 'glitch']
+
+class MediaScheduler(object):
+    """
+    Time-based updates (animations, video, gif, text glitches) of active media only,
+    advanced in one pass per frame. Objects register / unregister themselves when their
+    state changes (visibility, playback speed, animations started or stopped...).
+    """
+
+    def __init__(self):
+
+        self.items = {kind: {} for kind in MEDIA_KINDS}
+
+        # number of media updated in last frame
+        self.active = 0
+
+    def set(self, obj, kind, tick, active):
+        """
+        Register (or unregister if not active) an object's update method
+        """
+        items = self.items[kind]
+        if active:
+            items[obj] = tick
+        elif obj in items:
+            del items[obj]
+
+    def get_is_active(self):
+        """
+        Return True if any media (including hidden masks) is registered for updates
+        """
+        return any(self.items[kind] for kind in MEDIA_KINDS)
+
+    def tick(self):
+        """
+        Advance active media (from current engine time)
+        """
+        active = 0
+        for kind in MEDIA_KINDS:
+            ticks = self.items[kind]
+            if ticks:
+                # items may unregister while updating
+                ticks = list(ticks.values())
+                active += len(ticks)
+                for tick in ticks:
+                    tick()
+
+        self.active = active
@@ -1,67 +1,209 @@
 # encoding: utf-8
 
 from ..engine.osc import *
+from ..engine.patterns import osc_to_regexp, OscStore
 
 import pyliblo3 as liblo
-import re
+import traceback
+from queue import Queue, Empty
+from collections import deque
+from threading import Event
+from time import perf_counter
 import logging
 LOGGER = logging.getLogger(__name__)
 
-def osc_to_regexp_transliteration(match):
-    s = match.group(0)
-    s = s.replace("{","(")
-    s = s.replace("}",")")
-    s = s.replace(",","|")
-    return s
+# maximum number of pending commands, the receive thread waits when it's reached
+COMMAND_QUEUE_SIZE = 10000
 
-osc_to_regexp_re = re.compile(r"\{[^\}]*\}")
-
-osc_to_regexp_patterns = {
-    r"\?": ".",
-    r"\*": ".*",
-    r"\[!([^\]]*)\]": r"[^\1]",
-    r"\$": r"\$",
-    r"\^": r"\^",
-    r"\\": r"\\"
-}
-
-def osc_to_regexp(address):
-    """
-    Convert OSC 1.1 compliant address to regexp pattern standards
-    Escape ^, $ (start/end of string delimiters) and \ (escape char)
-    ?           -> .?
-    [!a-Z]      -> [^a-Z]
-    {foo,bar}   -> (foo|bar)
-
-    Params:
-    address : str
+class OscServer(OscNode):
 
-    Borrowed from pyoChainsaw @ https://framagit.org/groolot-association/pyoChainsaw
-    Copyleft Gregory David & JE Doucet (GNU GPLv3)
-    """
+    def __init__(self, name, port, *args, osc_time_budget=0, osc_message_budget=0, osc_coalesce=False, **kwargs):
 
-    for pattern, repl in osc_to_regexp_patterns.items():
-        address = re.sub(pattern, repl, address)
+        super(OscServer, self).__init__(*args, **kwargs)
 
-    return re.compile("^" + re.sub(osc_to_regexp_re, osc_to_regexp_transliteration, address) + "$")
+        self.name = name.lower()
 
+        # commands (osc messages and deferred calls) waiting to be applied by the render thread
+        self.commands = Queue(COMMAND_QUEUE_SIZE)
+        self.osc_backlog = 0
+        self.osc_processed = 0
 
-class OscServer(OscNode):
+        # commands of current batch not applied yet (render thread)
+        self.pending_commands = deque()
 
-    def __init__(self, name, port, *args, **kwargs):
+        # same-frame set messages coalescing
+        self.osc_coalesce = int(bool(osc_coalesce))
+        self.osc_coalesced = 0
 
-        super(OscServer, self).__init__(*args, **kwargs)
+        # per-frame processing budget (0 = unlimited)
+        self.osc_time_budget = osc_time_budget
+        self.osc_message_budget = osc_message_budget
 
-        self.name = name.lower()
+        # accept messages from the network
+        self.osc_input = True
 
-        self.server = liblo.Server(port)
-        self.server.add_method(None, None, self.route_osc)
+        # messages are received and decoded in a separate thread
+        self.server = liblo.ServerThread(port)
+        self.server.add_method(None, None, self.queue_osc)
+        self.server.start()
 
     def stop(self):
 
+        self.server.stop()
         self.server.free()
         self.server = None
 
+    def queue_osc(self, path, args):
+        """
+        Store incoming message (receive thread), it will be routed by process_osc()
+        """
+        if not self.osc_input:
+            LOGGER.debug('ignored message %s %s (osc input disabled)' % (path, args))
+            return
+        self.commands.put((self.route_osc, (path, args), None))
+
+    def defer(self, method, *args):
+        """
+        Call method from the render thread, at the beginning of next frame.
+        Returns an Event that is set once the call is done.
+        """
+        done = Event()
+        self.commands.put((method, args, done))
+        return done
+
+    def process_osc(self):
+        """
+        Apply commands received before the beginning of the frame, within the per-frame budget.
+        Commands left over are applied in the next frames, before a new batch is taken from the queue.
+        """
+        pending = self.pending_commands
+
+        if not pending:
+            commands = self.commands
+            batch = []
+            for i in range(commands.qsize()):
+                try:
+                    batch.append(commands.get_nowait())
+                except Empty:
+                    break
+            if self.osc_coalesce and len(batch) > 1:
+                batch = self.coalesce_commands(batch)
+            pending.extend(batch)
+
+        deadline = perf_counter() + self.osc_time_budget / 1000. if self.osc_time_budget > 0 else None
+        count = 0
+
+        while pending:
+            method, args, done = pending.popleft()
+
+            try:
+                method(*args)
+            except Exception as e:
+                LOGGER.error('error while applying command %s %s' % (method.__name__, args))
+                print(traceback.format_exc())
+            finally:
+                if done is not None:
+                    done.set()
+
+            count += 1
+            if count == self.osc_message_budget:
+                break
+            if deadline is not None and perf_counter() > deadline:
+                break
+
+        self.osc_backlog = len(pending) + self.commands.qsize()
+        self.osc_processed += count
+
+    def get_coalesce_key(self, command):
+        """
+        Return (address, property) if command is an absolute osc set on a slide, text,
+        output, camera or post_process, None otherwise.
+        """
+        method, args, done = command
+
+        if method != self.route_osc:
+            return None
+
+        address, values = args
+        path = address.lower().strip('/').split('/')
+
+        if len(path) < 3 or path[-1] != 'set' or len(values) < 2:
+            return None
+
+        if path[1] in ('slide', 'text', 'output'):
+            if len(path) != 4:
+                return None
+        elif path[1] in ('camera', 'post_process'):
+            if len(path) != 3:
+                return None
+        else:
+            return None
+
+        for v in values[1:]:
+            if isinstance(v, str) and len(v) > 1 and v[0] in '+-*/':
+                # relative value
+                return None
+
+        return ('/'.join(path), str(values[0]).lower())
+
+    def coalesce_commands(self, batch):
+        """
+        Drop set messages overridden by a later set of the same property on the same address.
+        Any other command is a barrier: messages are never dropped across it.
+        """
+        kept = []
+        seen = set()
+
+        for command in reversed(batch):
+            key = self.get_coalesce_key(command)
+            if key is None:
+                seen.clear()
+            elif key in seen:
+                self.osc_coalesced += 1
+                continue
+            else:
+                seen.add(key)
+            kept.append(command)
+
+        kept.reverse()
+
+        return kept
+
+    @osc_property('osc_time_budget', 'osc_time_budget')
+    def set_osc_time_budget(self, budget):
+        """
+        Maximum time spent processing osc messages per frame in ms (0 = unlimited)
+        """
+        self.osc_time_budget = max(float(budget), 0)
+
+    @osc_property('osc_message_budget', 'osc_message_budget')
+    def set_osc_message_budget(self, budget):
+        """
+        Maximum number of osc messages processed per frame (0 = unlimited)
+        """
+        self.osc_message_budget = max(int(budget), 0)
+
+    @osc_property('osc_coalesce', 'osc_coalesce')
+    def set_osc_coalesce(self, coalesce):
+        """
+        Keep only the last set of a property on a given address among messages received between two frames (0|1)
+        """
+        self.osc_coalesce = int(bool(coalesce))
+
+    @osc_property('osc_coalesced', 'osc_coalesced')
+    def set_osc_coalesced_ro(self):
+        """
+        Number of redundant set messages dropped by osc_coalesce (read-only)
+        """
+        pass
+
+    @osc_property('osc_backlog', 'osc_backlog')
+    def set_osc_backlog_ro(self):
+        """
+        Number of osc messages waiting to be processed (read-only)
+        """
+        pass
+
     def get_osc_path(self):
         return '/%s' % self.name
 
@@ -76,11 +218,7 @@ class OscServer(OscNode):
             if name in store:
                 children.append(store[name])
             elif '{' in name or '[' in name or '*' in name:
-                regexp = osc_to_regexp(name)
-                for name in store:
-                    match = regexp.match(name)
-                    if match != None and len(match.string) > 0:
-                        children.append(store[name])
+                children = store.match(name)
 
         return children
 
@@ -101,6 +239,9 @@ class OscServer(OscNode):
             LOGGER.debug('ignored message %s %s' % (address, args))
             return
 
+        # stage may change, next frame can't be skipped
+        self.need_redraw = True
+
         if path[0] == 'slide':
             target = self.get_children(self.slides, path[1])
             cmd = path[2]
@@ -113,6 +254,9 @@ class OscServer(OscNode):
         elif path[0] == 'text':
             target = self.get_children(self.texts, path[1])
             cmd = path[2]
+        elif path[0] == 'output':
+            target = self.get_children(self.outputs, path[1])
+            cmd = path[2]
         elif path[0] == 'selected':
             target = self.get_children(self.slides, self.selected)
             cmd = path[1]
@@ -236,7 +380,7 @@ class OscServer(OscNode):
 
                 for name in methods[c]:
                     method = obj.osc_attributes[name]
-                    spec = getfullargspec(method)
+                    spec = getfullargspec(inspect.unwrap(method))
                     args = spec.args[1:]
                     if spec.defaults:
                         l = len(spec.defaults)
@@ -272,3 +416,8 @@ class OscServer(OscNode):
         self.debug_text.state_reset()
         print_methods('  /%s/text/<name>/' % self.name, self.debug_text)
         print_properties(self.debug_text)
+
+        print('\nOutputs')
+        self.create_output('api')
+        print_methods('  /%s/output/<name>/' % self.name, self.outputs['api'])
+        print_properties(self.outputs['api'])
@@ -0,0 +1,60 @@
+# encoding: utf-8
+
+from bisect import bisect_left, bisect_right
+
+class ZOrderedList(list):
+    """
+    List of slides kept in drawing order (far to near, by z-index).
+    Slides with the same z-index are ordered by their z_rank (creation order).
+    Insertion, removal and z-index updates cost a binary search instead of a full sort.
+    """
+
+    def __init__(self):
+
+        super(ZOrderedList, self).__init__()
+
+        self.keys = []
+        self.item_keys = {}
+
+    def get_key(self, item):
+        return (-item.pos_z, item.z_rank)
+
+    def add(self, item):
+        """
+        Insert item at its drawing position
+        """
+        if item in self.item_keys:
+            return
+
+        key = self.get_key(item)
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.insert(index, item)
+        self.item_keys[item] = key
+
+    def remove(self, item):
+        """
+        Remove item (located with the key it was sorted with)
+        """
+        key = self.item_keys.pop(item)
+        index = bisect_left(self.keys, key)
+        del self.keys[index]
+        del self[index]
+
+    def discard(self, item):
+        """
+        Remove item if present
+        """
+        if item in self.item_keys:
+            self.remove(item)
+
+    def update(self, item):
+        """
+        Move item to its new drawing position (z-index changed)
+        """
+        if item in self.item_keys and self.item_keys[item] != self.get_key(item):
+            self.remove(item)
+            self.add(item)
+
+    def __contains__(self, item):
+        return item in self.item_keys
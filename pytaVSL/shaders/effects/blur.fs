@@ -4,7 +4,7 @@ float gauss( float x, float sigma)
     return exp(-(x * x) / ( 2.0 * sigma)) / ( 2.0 * 3.14157 * sigma);
 }
 
-vec3 add_blur(vec3 fragColor, float radius)
+vec3 add_blur(vec3 fragColor, float radius, float taps)
 {
 
     const float sigma = 10.0;
@@ -12,16 +12,22 @@ vec3 add_blur(vec3 fragColor, float radius)
     vec4 texCol   = tex2D(tex0, coords);
     vec4 gaussCol = vec4(texCol.rgb, 1.0);
 
+    // taps per side (up to 16), spread over the same extent
+    float stride = 16.0 / taps;
+    float offset;
     float weight;
     for (int i = 1; i <= 16; ++ i)
     {
-        weight = gauss(float(i) / 16.0, sigma * 0.5);
+        if (float(i) > taps) break;
+
+        offset = float(i) * stride;
+        weight = gauss(offset / 16.0, sigma * 0.5) * stride;
 
         if (weight < 1.0 / 255.0) break;
 
-        texCol    = tex2D(tex0, coords + radius * step * float(i));
+        texCol    = tex2D(tex0, coords + radius * step * offset);
         gaussCol += vec4(texCol.rgb * weight, weight);
-        texCol    = tex2D(tex0, coords - radius * step * float(i));
+        texCol    = tex2D(tex0, coords - radius * step * offset);
         gaussCol += vec4(texCol.rgb * weight, weight);
     }
 
@@ -18,7 +18,7 @@ gl_FragColor = tex2D(tex0, coords);
 #endif
 
 #ifdef BLUR
-gl_FragColor.rgb = add_blur(gl_FragColor.rgb, unif[18][0]);
+gl_FragColor.rgb = add_blur(gl_FragColor.rgb, unif[18][0], unif[18][1]);
 #endif
 
 #ifdef VIDEO
@@ -7,6 +7,7 @@ import logging
 LOGGER = logging.getLogger(__name__)
 
 from inspect import getmembers
+from time import perf_counter
 
 EASING_NAMES = [
     "linear",
@@ -189,6 +190,7 @@ class Animable(object):
             end = [args[i + argcount] for i in range(argcount)]
 
             self.animations[attribute] = Animation(self.parent, attribute, start, end, duration, loop, easing, method)
+            self.update_scheduled()
 
         else:
             LOGGER.error('invalid property argument "%s" for %s/animate' % (attribute, self.get_osc_path()))
@@ -206,6 +208,8 @@ class Animable(object):
         if len(properties) == 0:
             self.animations = {}
 
+        self.update_scheduled()
+
     @osc_method('strobe')
     def strobe(self, property, *args):
         """
@@ -242,6 +246,7 @@ class Animable(object):
                 end = [args[i + argcount] for i in range(argcount)]
 
                 self.strobes[attribute] = Strobe(self.parent, start, end, duration, ratio, method)
+                self.update_scheduled()
 
         else:
             LOGGER.error('invalid property argument "%s" for %s/strobe' % (attribute, self.get_osc_path()))
@@ -259,12 +264,32 @@ class Animable(object):
         if len(properties) == 0:
             self.strobes = {}
 
-    def draw(self, *args, **kwargs):
+        self.update_scheduled()
+
+    def get_is_animated(self):
+        """
+        Return True if the slide may change from one frame to the next
+        """
+        return bool(self.animations or self.strobes)
+
+    def update_scheduled(self):
+        """
+        Register time-based updates in the engine's media scheduler (drawable objects)
+        """
+        pass
+
+    def animations_update(self):
         """
         Compute current state of animations
         """
-        self.update_animations()
-        super(Animable, self).draw(*args, **kwargs)
+
+        profiler = self.parent.profiler
+        if profiler.enabled:
+            t = perf_counter()
+            self.update_animations()
+            profiler.lap('animations', t)
+        else:
+            self.update_animations()
 
     def update_animations(self):
         if self.animations:
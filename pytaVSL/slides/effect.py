@@ -2,6 +2,7 @@
 
 import random
 import ctypes
+from time import perf_counter
 from pi3d.constants import opengles, GLsizei
 
 from ..shaders.shaders import get_shader
@@ -10,8 +11,8 @@ from ..engine.osc import osc_property
 import logging
 LOGGER = logging.getLogger(__name__)
 
-import time
-origin = time.time()
+# blur samples per side at full quality (see shaders/effects/blur.fs)
+BLUR_TAPS = 16
 
 class Effect(object):
 
@@ -29,7 +30,7 @@ class Effect(object):
           15  invert, noise, charcoal                     45  47
           16  rgbwave, fish, hue                          48  50
           17  brightness, contrast, saturation            51  53
-          18  blur, unused, unused                        54  56
+          18  blur, blur taps, unused                     54  56
           19  unused, unused, unused                      57  59
         ===== ========================================== ==== ==
         """
@@ -79,18 +80,33 @@ class Effect(object):
         self.set_effect_saturation(self.effect_saturation)
 
         self.effect_blur = 0.0
+        self.unif[55] = BLUR_TAPS
         self.set_effect_blur(self.effect_blur)
 
+    def get_is_animated(self):
+        """
+        Time-based effects change every frame
+        """
+        return self.effect_noise != 0 or self.effect_rgbwave != 0 or super(Effect, self).get_is_animated()
+
     def toggle_effect(self, name, state):
         if state and name not in self.active_effects:
             self.active_effects.append(name)
             self.active_effects_changed = True
+            self.draw_plan = None
         elif not state and name in self.active_effects:
             self.active_effects.remove(name)
             self.active_effects_changed = True
+            self.draw_plan = None
 
     def apply_effect_changes(self):
-        self.set_shader(get_shader(self.active_effects))
+        profiler = self.parent.profiler
+        if profiler.tracing:
+            t = perf_counter()
+            self.set_shader(get_shader(self.active_effects))
+            profiler.span('shader %s' % '_'.join(self.active_effects), 'shader', t)
+        else:
+            self.set_shader(get_shader(self.active_effects))
         self.active_effects_changed = False
         if self.effect_mask:
             self.effect_mask_transform_loc = opengles.glGetUniformLocation(self.shader.program, b'mask_transform')
@@ -152,11 +168,26 @@ class Effect(object):
         self.toggle_effect('NOISE', self.effect_noise != 0)
 
 
+    def get_effect_mask_slide(self):
+        """
+        Return slide used as mask (if any)
+        """
+        if self.effect_mask:
+            slides = self.parent.get_children(self.parent.slides, self.effect_mask)
+            if slides:
+                return slides[0]
+        return None
+
     @osc_property('mask', 'effect_mask')
     def set_effect_mask(self, slide=''):
         """
         slide name to use as a mask (empty or ommitted to reset)
         """
+        mask = self.get_effect_mask_slide()
+        if mask is not None:
+            mask.mask_users.discard(self)
+            mask.update_scheduled()
+
         if slide == '':
             if len(self.buf[0].textures) == 2:
                 del self.buf[0].textures[1]
@@ -168,6 +199,8 @@ class Effect(object):
         if target:
             target = target[0]
             self.effect_mask = target.name
+            target.mask_users.add(self)
+            target.update_scheduled()
             tex = target.buf[0].textures[0]
             if len(self.buf[0].textures) == 1:
                 self.buf[0].textures.append(tex)
@@ -256,21 +289,28 @@ class Effect(object):
 
     def draw(self, *args, **kwargs):
 
+        self.effect_update()
+
+        super(Effect, self).draw(*args, **kwargs)
+
+    def effect_update(self):
+        """
+        Update time-based and mask uniforms, apply shader changes
+        """
         self.unif[36] = random.random()
-        self.unif[37] = self.parent.time - origin
+        self.unif[37] = self.parent.time - self.parent.time_origin
+        if self.effect_blur:
+            # quality governor: fewer samples per side
+            self.unif[55] = BLUR_TAPS * self.parent.quality_blur
         if self.active_effects_changed:
             self.apply_effect_changes()
 
         if self.effect_mask:
-            slides = self.parent.get_children(self.parent.slides, self.effect_mask)
-            if slides:
-                mask = slides[0]
-                if not mask.visible:
-                    mask.update_animations()
+            # hidden masks' animations are advanced by the media scheduler
+            mask = self.get_effect_mask_slide()
+            if mask is not None:
                 self.effect_mask_transform[0] = mask.xyz[0]
                 self.effect_mask_transform[1] = mask.xyz[1]
                 self.effect_mask_transform[2] = mask.sx
                 self.effect_mask_transform[3] = mask.sy
                 opengles.glUniform4fv(self.effect_mask_transform_loc, GLsizei(1), self.effect_mask_transform)
-
-        super(Effect, self).draw(*args, **kwargs)
@@ -91,12 +91,16 @@ class Gif(object):
             self.gif_normal_index = self.gif_index / (self.gif_length - 1)
 
 
-    def draw(self, *args, **kwargs):
+    def update_scheduled(self):
 
-        if self.gif and self.get_is_visible():
-            self.gif_next_frame()
+        if self.gif:
+            self.parent.media_scheduler.set(self, 'gif', self.gif_next_frame, self.is_visible and self.gif_speed != 0)
+
+        super(Gif, self).update_scheduled()
 
-        super(Gif, self).draw(*args, **kwargs)
+    def get_is_animated(self):
+
+        return (self.gif is not None and self.gif_speed != 0) or super(Gif, self).get_is_animated()
 
     @osc_property('gif_frame', 'gif_index')
     def set_frame_index(self, frame):
@@ -107,6 +111,7 @@ class Gif(object):
             self.gif_changed_time = 0
             self.gif_index = int(frame) % self.gif_length
             self.gif_normal_index = self.gif_index / (self.gif_length - 1)
+            self.osc_set_changed('gif_position')
             self.buf[0].textures[0].update_ndarray(self.gif[self.gif_index].ndarray, 0)
 
     @osc_property('gif_position', 'gif_normal_index', shorthand=True)
@@ -126,6 +131,9 @@ class Gif(object):
         gif playback speed (0=paused, negative=reverse)
         """
         self.gif_speed = float(speed)
+        # restart frame timing (not updated while paused)
+        self.gif_changed_time = 0
+        self.update_scheduled()
 
     @osc_property('gif_duration', 'gif_duration')
     def set_duration(self, duration):
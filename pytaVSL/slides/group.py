@@ -1,4 +1,5 @@
 from ..engine.osc import osc_property
+from ..engine.zorder import ZOrderedList
 
 import logging
 LOGGER = logging.getLogger(__name__)
@@ -8,7 +9,6 @@ class Group(object):
     def __init__(self, *args, **kwargs):
 
         self.is_group = False
-        self.children_need_sorting = False
 
         self.is_sequence = 0
         self.sequence_index = 0
@@ -18,16 +18,12 @@ class Group(object):
 
         super(Group, self).__init__(*args, **kwargs)
 
-    def draw(self, *args, **kwargs):
-
-        if self.get_is_visible():
+        # z-sorted children
+        self.children = ZOrderedList()
 
-            if self.children_need_sorting:
-                self.children = sorted(self.children, key=lambda slide: slide.pos_z, reverse=True)
-                self.children_need_sorting = False
+    def draw(self, *args, **kwargs):
 
-                if self.is_sequence:
-                    self.set_sequence_index(self.sequence_index)
+        if self.is_visible:
 
             if self.is_group and self.active_effects:
                 # capture children.draw()
@@ -36,16 +32,21 @@ class Group(object):
             super(Group, self).draw(*args, **kwargs)
 
             if self.is_group and self.active_effects:
-                # stop capture
-                self.post_process.capture_end()
-                # copy shader uniforms
-                self.post_process.unif[:] = self.unif[:]
-                self.post_process.buf[0].unib[:] = self.buf[0].unib[:]
-                self.post_process.unif_warp[:] = self.unif_warp[:]
-                # draw
-                if self.pos_z != self.post_process.pos_z:
-                    self.post_process.position(self.post_process.pos_x, self.post_process.pos_y, self.pos_z)
-                self.post_process.draw()
+                self.group_draw_post_process()
+
+    def group_draw_post_process(self):
+        """
+        Stop children capture and draw it with the group's effects
+        """
+        self.post_process.capture_end()
+        # copy shader uniforms
+        self.post_process.unif[:] = self.unif[:]
+        self.post_process.buf[0].unib[:] = self.buf[0].unib[:]
+        self.post_process.unif_warp[:] = self.unif_warp[:]
+        # draw
+        if self.pos_z != self.post_process.pos_z:
+            self.post_process.position(self.post_process.pos_x, self.post_process.pos_y, self.pos_z)
+        self.post_process.draw()
 
     def toggle_effect(self, *args, **kwargs):
         """
@@ -58,6 +59,7 @@ class Group(object):
             if not self.post_process:
                 from ..slides.postprocess import PostProcess
                 self.post_process = PostProcess(self.parent)
+                self.post_process.set_resolution(self.parent.get_group_resolution())
                 self.post_process.set_visible(1)
 
             self.post_process.toggle_effect(*args, **kwargs)
@@ -81,9 +83,21 @@ class Group(object):
         """
         Override add_child to handle z-sorting
         """
-        super(Group, self).add_child(child)
         child.set_position_z(child.pos_z - self.pos_z)
-        self.children_need_sorting = True
+        self.children.add(child)
+        self.sort_slides()
+        self.parent.update_visible_slides(child)
+
+    def sort_slides(self, child=None):
+        """
+        Move child to its drawing position (z-index changed)
+        and update sequence if children order changed
+        """
+        if child is not None:
+            self.children.update(child)
+
+        if self.is_sequence:
+            self.set_sequence_index(self.sequence_index)
 
     @osc_property('sequence_mode', 'is_sequence')
     def set_sequence_mode(self, mode):
@@ -0,0 +1,120 @@
+# encoding: utf-8
+
+import pi3d
+import numpy
+from pi3d.Shape import Shape
+from pi3d.Buffer import Buffer
+
+from ..slides.text import Text, FONTS
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+class FrameGraph(Shape):
+    """
+    Frame time bars: quads are allocated once, only their heights are updated
+    """
+    def __init__(self, camera, bars=100, w=200.0, h=50.0, x=0.0, y=0.0, z=0.0):
+
+        super(FrameGraph, self).__init__(camera, None, 'frame_graph', x, y, z, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0)
+
+        self.bars = bars
+        self.height = h
+        self.values = numpy.zeros(bars, dtype='float32')
+        self.changed = False
+
+        # 4 vertices per bar: bottom-left, top-left, top-right, bottom-right
+        bar_width = w / bars
+        verts = []
+        texcoords = []
+        inds = []
+        for i in range(bars):
+            x0 = i * bar_width
+            x1 = x0 + bar_width * 0.8
+            verts += [(x0, 0.0, 0.0), (x0, 0.0, 0.0), (x1, 0.0, 0.0), (x1, 0.0, 0.0)]
+            texcoords += [(0.0, 0.0)] * 4
+            n = i * 4
+            inds += [(n + 1, n, n + 2), (n + 2, n, n + 3)]
+
+        self.vertices = numpy.array(verts, dtype='float32')
+
+        self.buf = [Buffer(self, verts, texcoords, inds, None)]
+        self.set_shader(pi3d.Shader('mat_flat'))
+        self.set_material((0.0, 1.0, 0.0))
+
+    def push(self, value):
+        """
+        Append a value (1.0 = half the graph's height) and scroll bars
+        """
+        self.values[:-1] = self.values[1:]
+        self.values[-1] = min(value, 2.0)
+        self.changed = True
+
+    def draw(self, *args, **kwargs):
+
+        if self.changed:
+            heights = self.values * self.height / 2.
+            self.vertices[1::4, 1] = heights
+            self.vertices[2::4, 1] = heights
+            self.buf[0].re_init(pts=self.vertices)
+            self.changed = False
+
+        super(FrameGraph, self).draw(*args, **kwargs)
+
+class Hud(object):
+    """
+    Performance overlay: fps, frame times, gpu memory, osc backlog and status.
+    Text is rebuilt only when its content changes (values are refreshed once per second),
+    frame time bars are updated in place.
+    """
+    def __init__(self, parent):
+
+        self.parent = parent
+        self.visible = False
+        self.last_time = None
+
+        self.text = Text(parent, 'hud', font=FONTS["mono"], init_z=-100)
+        self.text.set_size(0.025)
+        self.text.set_align('top', 'left')
+        self.text.set_visible(1)
+
+        w = parent.width / 4.
+        h = parent.height / 8.
+        margin = parent.height / 50.
+        self.graph = FrameGraph(parent.OUTPUT_CAMERA, w=w, h=h,
+                                x=-parent.width / 2. + margin, y=-parent.height / 2. + margin, z=-100)
+
+    def set_visible(self, visible):
+
+        self.visible = bool(visible)
+        self.last_time = None
+
+    def update(self):
+        """
+        Refresh text values (called once per second)
+        """
+        parent = self.parent
+        monitor = parent.monitor
+
+        self.text.set_text('fps: %i\nvram: %i/%iMB\nosc: %i\n%s' % (
+            parent.measured_fps,
+            monitor.allocated / 1000000,
+            monitor.max / 1000000,
+            parent.osc_backlog,
+            parent.status
+        ))
+
+    def draw(self):
+
+        if not self.visible:
+            return
+
+        # measured frame interval relative to target frame duration
+        # (engine time follows the frame schedule, not the actual frame times)
+        time = self.parent.pacer.now()
+        if self.last_time is not None:
+            self.graph.push((time - self.last_time) * self.parent.fps)
+        self.last_time = time
+
+        self.text.draw()
+        self.graph.draw()
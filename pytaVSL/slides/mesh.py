@@ -27,17 +27,26 @@ class Mesh(Shape):
         self.width = w
         self.height = h
         self.mesh_size = mesh_size
+        self.mesh_size_max = 0
         self.mesh_debug = 0
         self.buf = []
 
         self.create_mesh_buffer()
 
 
+    def get_mesh_size(self):
+        """
+        Return actual mesh size (limited to mesh_size_max if not 0)
+        """
+        if self.mesh_size_max:
+            return [min(n, self.mesh_size_max) for n in self.mesh_size]
+        return self.mesh_size
+
     def create_mesh_buffer(self):
 
         ww = self.width / 2.0
         hh = self.height / 2.0
-        nx, ny = self.mesh_size
+        nx, ny = self.get_mesh_size()
 
         verts = []
         texcoords = []
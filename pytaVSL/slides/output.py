@@ -0,0 +1,41 @@
+# encoding: utf-8
+
+from ..engine.osc import osc_property
+from ..slides.slide import SlideBase
+from ..slides.state import State
+from ..slides.warp import Warp
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+class Output(State, Warp, SlideBase):
+    """
+    Output region: displays a part of the rendered stage (shared texture).
+    Stage rendering is done once whatever the number of outputs.
+    """
+
+    def __init__(self, parent, name, texture):
+
+        self.crop = [0.0, 0.0, 1.0, 1.0]
+
+        super(Output, self).__init__(parent=parent, name=name, texture=texture, width=parent.width, height=parent.height)
+
+        # not affected by camera moves
+        self._camera = parent.OUTPUT_CAMERA
+
+        # texture memory is accounted for by the render target
+        self.loaded = True
+
+    def get_osc_path(self):
+        return '/%s/output/%s' % (self.parent.name, self.name)
+
+    @osc_property('crop', 'crop')
+    def set_crop(self, x, y, w, h):
+        """
+        stage area displayed by the output (0<>1)
+            x, y: area's top-left corner
+            w, h: area's size
+        """
+        self.crop = [float(x), float(y), float(w), float(h)]
+        self.set_tiles(self.crop[2], self.crop[3])
+        self.set_texture_offset(self.crop[0] + (self.crop[2] - 1) / 2., self.crop[1] + (self.crop[3] - 1) / 2.)
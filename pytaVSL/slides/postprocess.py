@@ -1,6 +1,9 @@
 # encoding: utf-8
 
+from pi3d.util import OffScreenTexture as offscreen
 from pi3d.util.OffScreenTexture import OffScreenTexture
+from pi3d.constants import (opengles, GL_TEXTURE_2D, GL_RGBA, GL_UNSIGNED_BYTE, GL_DEPTH_COMPONENT16,
+    GL_DEPTH_COMPONENT, GL_UNSIGNED_SHORT)
 
 
 from ..slides.perspective import Perspective
@@ -20,6 +23,34 @@ class OffScreenTex(OffScreenTexture):
     def __init__(self, *args, **kwargs):
         super(OffScreenTex, self).__init__(*args, **kwargs)
         self.image = FakeTexImage(self.ix, self.iy)
+        self.scale = 1.0
+
+    def resize(self, scale):
+        """
+        Reallocate color and depth textures at a fraction of the display's resolution
+        """
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        self.ix = self.color.ix = self.depth.ix = max(int(self.disp.width * scale), 1)
+        self.iy = self.color.iy = self.depth.iy = max(int(self.disp.height * scale), 1)
+        self.image = FakeTexImage(self.ix, self.iy)
+
+        opengles.glBindTexture(GL_TEXTURE_2D, self.color._tex)
+        opengles.glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, self.ix, self.iy, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        opengles.glBindTexture(GL_TEXTURE_2D, self.depth._tex)
+        opengles.glTexImage2D(GL_TEXTURE_2D, 0, GL_DEPTH_COMPONENT16, self.ix, self.iy, 0, GL_DEPTH_COMPONENT, GL_UNSIGNED_SHORT, None)
+        opengles.glBindTexture(GL_TEXTURE_2D, 0)
+
+    def _start(self, clear=True):
+        super(OffScreenTex, self)._start(clear)
+        opengles.glViewport(0, 0, self.ix, self.iy)
+
+    def _end(self):
+        super(OffScreenTex, self)._end()
+        if not offscreen.OFFSCREEN_QUEUE:
+            opengles.glViewport(0, 0, self.disp.width, self.disp.height)
 
 class PostProcess(State, Perspective, Warp, SlideBase):
 
@@ -35,5 +66,11 @@ class PostProcess(State, Perspective, Warp, SlideBase):
     def capture_end(self):
         self.buf[0].textures[0]._end()
 
+    def set_resolution(self, scale):
+        """
+        Render captured slides at a fraction of the display's resolution
+        """
+        self.buf[0].textures[0].resize(scale)
+
     def get_osc_path(self):
         return '/%s/post_process' % self.parent.name
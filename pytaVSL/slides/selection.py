@@ -0,0 +1,53 @@
+# encoding: utf-8
+
+import pi3d
+import ctypes
+import numpy
+from pi3d.Buffer import Buffer
+from pi3d.constants import opengles, GL_LINE_LOOP, GL_ALWAYS, GL_LESS
+
+import logging
+LOGGER = logging.getLogger(__name__)
+
+class SelectionOutline(object):
+    """
+    Selected slide's outline: a 4 vertices line loop following the slide's (warped) corners,
+    drawn with the slide's matrices from its last draw and a flat color shader (one draw call).
+    """
+
+    def __init__(self, color=(0.0, 1.0, 0.0), line_width=2.0):
+
+        self.shader = pi3d.Shader('mat_flat')
+        self.unif = (ctypes.c_float * 60)()
+        self.color = color
+
+        self.corners = numpy.zeros((4, 3), dtype='float32')
+        # line loop: 0, 1, 2, 3 (elements are drawn by triangles, last ones are degenerate)
+        self.buf = Buffer(self, self.corners, [(0.0, 0.0)] * 4, [(0, 1, 2), (3, 0, 0)], normals=[(0.0, 0.0, -1.0)] * 4)
+        self.buf.draw_method = GL_LINE_LOOP
+        # material color (fog color is set as well in case fog applies)
+        self.buf.unib[3:6] = color
+        # passed to glLineWidth by pi3d when not drawing triangles
+        self.buf.unib[11] = line_width
+
+    def draw(self, slide):
+
+        if not slide.loaded or slide.drawn_frame != slide.parent.frame_count:
+            # not drawn in this frame (hidden, culled...): matrices are outdated
+            return
+
+        corners = numpy.array([(x, y, 0.0) for x, y in slide.get_warp_corners()], dtype='float32')
+        if (corners != self.corners).any():
+            self.corners = corners
+            self.buf.re_init(pts=corners)
+
+        # slide's uniforms with a plain opaque color
+        self.unif[:] = slide.unif[:]
+        self.unif[12:15] = self.color
+        self.unif[16] = 1.0
+        self.unif[17] = 1.0
+
+        # always on top
+        opengles.glDepthFunc(GL_ALWAYS)
+        self.buf.draw(slide, slide.M, self.unif, self.shader)
+        opengles.glDepthFunc(GL_LESS)
@@ -1,7 +1,10 @@
 # encoding: utf-8
 
 import pi3d
+import numpy
 import colorsys
+from pi3d.Shape import Shape
+from time import perf_counter
 import random
 
 from ..slides.state import State
@@ -38,6 +41,9 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
 
             texture = pi3d.Texture(texture, flip=True)
 
+        # slides using this one as a mask
+        self.mask_users = set()
+
         super(SlideBase, self).__init__(w=width if width is not None else texture.ix, h=height if height is not None else texture.iy, mesh_size=mesh_size)
 
         self.name = name
@@ -45,6 +51,9 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
         self.server = parent.server
         self.parent_slide = None
 
+        # quality governor
+        self.mesh_size_max = parent.quality_mesh_max
+
         self.is_clone = False
         self.clone_target = None
 
@@ -52,6 +61,8 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
             self.set_textures([texture])
 
         self.visible = 0
+        # effective visibility (own and parent groups' visibility)
+        self.is_visible = False
 
         # Color
         self.color = [0.5,0.5,0.5]
@@ -62,6 +73,7 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
         self.pos_x = 0.0
         self.pos_y = 0.0
         self.pos_z = self.init_z = self.last_z = init_z
+        self.z_rank = (0, 0)
 
         # Position offest
         self.offset_x = 0.0
@@ -93,41 +105,59 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
         self.set_zoom(1.0)
         self.set_position_z(self.pos_z)
 
+    def get_is_animated(self):
+
+        return self.color_strobe > 0 or super(SlideBase, self).get_is_animated()
+
+    def osc_get_is_volatile(self):
+        """
+        Time-based updates (video, gif, glitches...) change properties directly
+        """
+        return self.get_is_animated()
+
     def draw(self, *args, **kwargs):
         """
         Main drawing function
         """
 
-        if self.get_is_visible():
+        if self.is_visible:
 
             if self.color_strobe > 0:
-                rgb = list(colorsys.hsv_to_rgb(random.random(), 1.0, 1.0))
-                rgb[random.randint(0,2)] *= self.color_strobe
-                self.set_material(rgb)
+                self.color_strobe_update()
 
             if not self.loaded:
                 self.loaded = True
                 if not self.parent.monitor.alloc(self):
                     return
 
+                profiler = self.parent.profiler
+                if profiler.tracing:
+                    # first draw: textures are uploaded to the gpu
+                    t = perf_counter()
+                    super(SlideBase, self).draw(*args, **kwargs)
+                    profiler.span('upload %s' % self.name, 'upload', t)
+                    return
+
             super(SlideBase, self).draw(*args, **kwargs)
 
+    def color_strobe_update(self):
+
+        rgb = list(colorsys.hsv_to_rgb(random.random(), 1.0, 1.0))
+        rgb[random.randint(0,2)] *= self.color_strobe
+        self.set_material(rgb)
+
     @osc_method('quit_group')
     def quit_group(self):
         """
         Quit current group (if part of one)
         """
         if self.parent_slide:
-            self.parent_slide.children.remove(self)
-            self.set_position_z(self.pos_z + self.parent_slide.init_z)
-            self.parent_slide.sort_slides()
+            group = self.parent_slide
+            group.children.remove(self)
             self.parent_slide = None
-
-    def sort_slides(self):
-        """
-        Sort children in drawing order (by z-index)
-        """
-        self.children_need_sorting = True
+            self.set_position_z(self.pos_z + group.init_z)
+            group.sort_slides()
+            self.parent.update_visible_slides(self)
 
     def unload(self):
         if self.loaded and not self.visible:
@@ -168,6 +198,16 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
             self.mesh_size = new_size
             self.create_mesh_buffer()
 
+    def set_mesh_size_max(self, size):
+        """
+        Limit mesh definition (quality governor), 0 for no limit
+        """
+        if size != self.mesh_size_max:
+            current = self.get_mesh_size()
+            self.mesh_size_max = size
+            if self.get_mesh_size() != current:
+                self.create_mesh_buffer()
+
     @osc_property('mesh_debug', 'mesh_debug')
     def set_mesh_wireframe(self, debug):
         """
@@ -209,20 +249,40 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
         """
         object visibility (0|1)
         """
-        self.visible = int(bool(visible))
+        visible = int(bool(visible))
+        if visible != self.visible:
+            self.visible = visible
+            self.update_is_visible()
+            self.parent.update_visible_slides(self)
 
     def get_is_visible(self):
         """
         return True if slide is actually visible
-        checks parent slides (groups) visiblity
+        (cached, includes parent slides (groups) visiblity)
         """
-        if not self.visible:
-            return False
+        return self.is_visible
 
-        if self.parent_slide is not None and not self.parent_slide.get_is_visible():
-            return False
+    def update_is_visible(self):
+        """
+        Update effective visibility when slide's visibility or group membership changed,
+        propagate to children
+        """
+        is_visible = bool(self.visible) and (self.parent_slide is None or self.parent_slide.is_visible)
 
-        return True
+        if is_visible != self.is_visible:
+            self.is_visible = is_visible
+            self.update_scheduled()
+            mask = self.get_effect_mask_slide()
+            if mask is not None:
+                mask.update_scheduled()
+            for child in self.children:
+                child.update_is_visible()
+
+    def update_scheduled(self):
+
+        # hidden masks are animated as long as a slide using them is visible
+        active = self.is_visible or any(user.is_visible for user in self.mask_users)
+        self.parent.media_scheduler.set(self, 'animations', self.animations_update, active and bool(self.animations or self.strobes))
 
     @osc_property('color', 'color')
     def set_color(self, r, g, b):
@@ -247,6 +307,7 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
         random color strobing (0|1)
         """
         self.color_strobe = float(strobe)
+        self.draw_plan = None
         if strobe <= 0:
             self.set_color(*self.color)
 
@@ -316,8 +377,9 @@ class SlideBase(OscNode, Effect, Animable, Mesh):
 
         if z_changed:
             self.last_z = self.pos_z + self.offset_z
-            parent = self.parent_slide if self.parent_slide is not None else self.parent
-            parent.sort_slides()
+            if self.parent_slide is not None:
+                self.parent_slide.sort_slides(self)
+            self.parent.sort_slides(self)
 
     @osc_property('position_x', 'pos_x', shorthand=True)
     def set_position_x(self, x):
@@ -434,8 +496,115 @@ class Slide(State, Group, Perspective, Video, Gif, Warp, SlideBase):
 
     def __init__(self, *args, **kwargs):
 
+        # stages called by draw(), compiled from active features
+        self.draw_plan = None
+
+        # engine frame in which the slide was last drawn
+        self.drawn_frame = -1
+
         super(Slide, self).__init__(*args, **kwargs)
 
+    def compile_draw_plan(self):
+        """
+        Return the stages of the mixins' draw() chain needed by current features
+        (before and after the actual drawing), in the same order.
+        Time-based updates are done by the engine's media scheduler.
+        Must be reset (draw_plan = None) when one of these features changes.
+        """
+        pre = []
+        post = []
+
+        if self.is_group and self.active_effects:
+            pre.append(self.post_process.capture_start)
+            post.append(self.group_draw_post_process)
+        if self.warp:
+            pre.append(self.warp_update)
+        if self.color_strobe > 0:
+            pre.append(self.color_strobe_update)
+        pre.append(self.effect_update)
+
+        return pre, post
+
+    def get_is_culled(self):
+        """
+        Return True if slide is fully transparent or outside the viewport
+        (top-level slides only, groups are never culled)
+        """
+        if self.parent_slide is not None or self.is_group:
+            return False
+
+        if self.color_alpha <= 0:
+            return True
+
+        # model matrix (as computed by pi3d.Shape.draw)
+        matrix = self.tr1
+        if self.rozflg:
+            matrix = numpy.dot(self.roz, matrix)
+        if self.roxflg:
+            matrix = numpy.dot(self.rox, matrix)
+        if self.royflg:
+            matrix = numpy.dot(self.roy, matrix)
+        if self.sclflg:
+            matrix = numpy.dot(self.scl, matrix)
+        if self.tr2flg:
+            matrix = numpy.dot(self.tr2, matrix)
+
+        camera = self._camera or pi3d.Camera.instance()
+        if not camera.mtrx_made:
+            camera.make_mtrx()
+
+        corners = numpy.array([[x, y, 0.0, 1.0] for x, y in self.get_warp_corners()])
+        clip = numpy.dot(numpy.dot(corners, matrix), camera.mtrx)
+
+        w = clip[:, 3]
+        if (w <= 0).any():
+            # behind the camera: don't bother
+            return False
+
+        x = clip[:, 0] / w
+        y = clip[:, 1] / w
+
+        return (x < -1).all() or (x > 1).all() or (y < -1).all() or (y > 1).all()
+
+    def draw(self, *args, **kwargs):
+        """
+        Draw using the compiled draw plan instead of walking the mixins' draw() chain
+        """
+        if not self.loaded:
+            # first draw: gpu memory accounting and texture upload
+            super(Slide, self).draw(*args, **kwargs)
+            self.drawn_frame = self.parent.frame_count
+            return
+
+        if not self.is_visible:
+            return
+
+        if self.draw_plan is None:
+            self.draw_plan = self.compile_draw_plan()
+
+        pre, post = self.draw_plan
+
+        if self.parent.culling and self.get_is_culled():
+            self.parent.culled_slides += 1
+            if self.video and self.parent.culling_video:
+                # pause decoding from next frame
+                self.video_culled = True
+            return
+
+        if self.video_culled:
+            # resume decoding where it was paused
+            self.video_elapsed_time = 0
+            self.video_culled = False
+
+        for stage in pre:
+            stage()
+
+        Shape.draw(self, *args, **kwargs)
+        self.drawn_frame = self.parent.frame_count
+
+        for stage in post:
+            stage()
+
     def get_osc_path(self):
         return '/%s/slide/%s' % (self.parent.name, self.name)
 
@@ -2,6 +2,7 @@
 
 import pi3d
 import random
+from time import perf_counter
 
 from ..slides.state import State
 from ..slides.slide import SlideBase
@@ -182,14 +183,17 @@ class Text(State, Perspective, SlideBase):
 
         if self.visible:
 
-            if self.glitch:
-                self.glitch_next()
-
             if self.string == '':
                 return
 
             if self.need_regen:
-                self.new_string()
+                profiler = self.parent.profiler
+                if profiler.enabled:
+                    t = perf_counter()
+                    self.new_string()
+                    profiler.lap('text', t)
+                else:
+                    self.new_string()
                 self.need_regen = False
 
             # font smoothing
@@ -197,6 +201,16 @@ class Text(State, Perspective, SlideBase):
 
             super(Text, self).draw(*args, **kwargs)
 
+    def update_scheduled(self):
+
+        self.parent.media_scheduler.set(self, 'glitch', self.glitch_next, self.is_visible and self.glitch)
+
+        super(Text, self).update_scheduled()
+
+    def get_is_animated(self):
+
+        return self.glitch or self.need_regen or super(Text, self).get_is_animated()
+
     def scale(self, sx, sy, sz):
         """
         Override Slide.scale to trigger string regeneration when needed
@@ -221,7 +235,11 @@ class Text(State, Perspective, SlideBase):
         if duration != 0:
             return self.set_glitch(string, duration)
         if stop_glitch:
-            self.glitch = False
+            if not self.glitch and str(string) == self.string:
+                return
+            if self.glitch:
+                self.glitch = False
+                self.update_scheduled()
 
         self.string = str(string)
 
@@ -245,6 +263,7 @@ class Text(State, Perspective, SlideBase):
         self.glitch_start = self.parent.time
         if isinstance(duration, (float, int)):
             self.glitch_duration = max(duration, 0.01)
+        self.update_scheduled()
         self.glitch_next()
 
     def glitch_next(self):
@@ -256,6 +275,7 @@ class Text(State, Perspective, SlideBase):
         if progress == 1.0:
             self.glitch_indices = []
             self.glitch = False
+            self.update_scheduled()
         elif progress == 0.0:
             self.glitch_indices = list(range(0, len(self.glitch_to)))
         else:
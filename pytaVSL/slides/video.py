@@ -14,6 +14,7 @@ import os.path
 
 import numpy
 import re
+from time import perf_counter
 
 
 video_support = False
@@ -27,6 +28,7 @@ class Video(object):
         self.audio = False
         self.video_speed = 1.0
         self.video_time = 0
+        self.video_skipped_frames = 0
         self.video_loop = 0
         self.video_duration = 0
         self.video_end = 0
@@ -34,6 +36,9 @@ class Video(object):
 
         self.last_visible = False
 
+        # decoding paused by culling
+        self.video_culled = False
+
         if isinstance(texture, str):
             match = videos_formats.match(texture.lower())
             if match and match.string:
@@ -98,16 +103,34 @@ class Video(object):
 
         super(Video, self).__del__()
 
-    def draw(self, *args, **kwargs):
+    def update_scheduled(self):
+
+        if self.video:
+            self.video_pre_draw()
+            self.parent.media_scheduler.set(self, 'video', self.video_update, self.is_visible and self.video_speed > 0)
+
+        super(Video, self).update_scheduled()
+
+    def video_update(self):
 
-        if self.video and self.get_is_visible():
+        if self.video_culled:
+            return
+
+        profiler = self.parent.profiler
+        if profiler.enabled:
+            t = perf_counter()
+            self.video_next_frame()
+            profiler.lap('video', t, self.name)
+        else:
             self.video_next_frame()
 
-        super(Video, self).draw(*args, **kwargs)
+    def get_is_animated(self):
+
+        return (self.video and self.video_speed > 0) or super(Video, self).get_is_animated()
 
     def video_pre_draw(self):
 
-        visible = self.get_is_visible()
+        visible = self.is_visible
 
         if visible != self.last_visible:
             if self.video and visible:
@@ -136,7 +159,7 @@ class Video(object):
 
         self.video_time = time
 
-        if self.get_is_visible():
+        if self.is_visible:
             self.set_video_time_internal()
         else:
             self.video_load_frame(self.video_blank_frame)
@@ -164,6 +187,7 @@ class Video(object):
 
         self.video_speed = max(float(speed), 0)
         self.video_elapsed_time = 0
+        self.update_scheduled()
 
         if self.audio:
             self.set_audio_sync()
@@ -225,6 +249,13 @@ class Video(object):
             self.video_time += frames * self.video_frame_duration
             # self.video_time = self.video_reader.get(cv2.CAP_PROP_POS_MSEC) / 1000.
 
+            if self.parent.quality_video_rate < 1:
+                # quality governor: upload fewer frames
+                self.video_skipped_frames += frames
+                if self.video_skipped_frames < 1. / self.parent.quality_video_rate:
+                    return
+                self.video_skipped_frames = 0
+
             ok, frame = self.video_reader.retrieve()
             if ok:
                 self.video_load_frame(frame)
@@ -261,7 +292,7 @@ class Video(object):
         if not self.audio:
             return
 
-        self.audio_reader.setMul(self.audio_volume * int(self.get_is_visible()))
+        self.audio_reader.setMul(self.audio_volume * int(self.is_visible))
 
     def set_audio_sync(self):
         """
@@ -270,7 +301,7 @@ class Video(object):
         if not self.audio:
             return
 
-        if self.get_is_visible() and self.video_speed == 1:
+        if self.is_visible and self.video_speed == 1:
             self.audio_reader.reset()
             self.audio_reader.setPhase(min(max(self.video_time / self.video_duration, 0.0), 1.0))
             self.audio_reader.out()
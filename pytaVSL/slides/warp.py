@@ -118,23 +118,24 @@ class Warp(object):
         # error
         LOGGER.error('%s: impossible texture warping' % self.name)
 
+    def get_warp_corners(self):
+        """
+        Return warped quadrilateral's corners in object space (top left, top right, bottom right, bottom left)
+        """
+        return [
+            ((self.warp_1[0] - 0.5) * self.width, (self.warp_1[1] + 1 - 0.5) * self.height),
+            ((self.warp_2[0] + 1 - 0.5) * self.width, (self.warp_2[1] + 1 - 0.5) * self.height),
+            ((self.warp_3[0] + 1 - 0.5) * self.width, (self.warp_3[1] - 0.5) * self.height),
+            ((self.warp_4[0] - 0.5) * self.width, (self.warp_4[1] - 0.5) * self.height)
+        ]
+
     def warp_vertices(self):
         """
         Move vertices to warped quadrilateral
             Positions are interpolated linearly -> no projective warping if mesh_size > [1, 1]
         """
 
-        p0x = (self.warp_1[0] - 0.5) * self.width
-        p0y = (self.warp_1[1] + 1 - 0.5) * self.height
-
-        p1x = (self.warp_2[0] + 1 - 0.5) * self.width
-        p1y = (self.warp_2[1] + 1 - 0.5) * self.height
-
-        p2x = (self.warp_3[0] + 1 - 0.5) * self.width
-        p2y = (self.warp_3[1] - 0.5) * self.height
-
-        p3x = (self.warp_4[0] - 0.5) * self.width
-        p3y = (self.warp_4[1] - 0.5) * self.height
+        (p0x, p0y), (p1x, p1y), (p2x, p2y), (p3x, p3y) = self.get_warp_corners()
 
         def interpolate(v1, v2, x):
             r1 = v1[0] + (v2[0] - v1[0]) * x
@@ -143,7 +144,7 @@ class Warp(object):
 
         ww = self.width / 2.0
         hh = self.height / 2.0
-        nx, ny = self.mesh_size
+        nx, ny = self.get_mesh_size()
         i = 0
         for x in range(nx + 1):
             for y in range(ny + 1):
@@ -169,10 +170,15 @@ class Warp(object):
 
         if self.visible:
 
-            if self.shader and self.warp:
-                if self.active_effects_changed:
-                    self.apply_effect_changes()
-                self.shader.use()
-                opengles.glUniform4fv(self.unif_warp_loc, 1, self.unif_warp)
+            if self.warp:
+                self.warp_update()
 
             super(Warp, self).draw(*args, **kwargs)
+
+    def warp_update(self):
+
+        if self.shader:
+            if self.active_effects_changed:
+                self.apply_effect_changes()
+            self.shader.use()
+            opengles.glUniform4fv(self.unif_warp_loc, 1, self.unif_warp)
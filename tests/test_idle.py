@@ -0,0 +1,50 @@
+# encoding: utf-8
+
+import unittest
+
+try:
+    import numpy
+    import pi3d
+    from pytaVSL.engine.core import PytaVSL
+    from pytaVSL.slides.slide import Slide
+except ImportError:
+    pi3d = None
+
+@unittest.skipIf(pi3d is None, 'requires pi3d and pyliblo3')
+class IdleSkipTest(unittest.TestCase):
+
+    def setUp(self):
+
+        pi3d.Log(name=None, level='WARNING')
+        try:
+            self.engine = PytaVSL(name='test', port=None, fps=60, width=64, height=64, headless=True,
+                                  offline=True, offline_duration=0.5)
+        except Exception as e:
+            self.skipTest('headless display unavailable (%s)' % e)
+
+        texture = pi3d.Texture(numpy.full((16, 16, 4), 255, dtype='uint8'))
+        self.slide = Slide(parent=self.engine, name='slide', texture=texture, width=64, height=64)
+        self.mask = Slide(parent=self.engine, name='mask', texture=texture, width=64, height=64)
+        self.engine.add_slide(self.slide)
+        self.engine.add_slide(self.mask)
+
+        self.slide.set_visible(1)
+        self.slide.set_effect_mask('mask')
+        self.engine.set_idle_skip(1)
+
+    def test_animated_hidden_mask(self):
+
+        self.engine.draw_frame()
+        self.engine.need_redraw = False
+        self.assertTrue(self.engine.get_is_idle())
+
+        # hidden mask, animated: the masked slide changes every frame
+        self.mask.animate('rotate_z', 0, 360, 1, 1)
+        self.assertFalse(self.mask.visible)
+        self.assertFalse(self.engine.get_is_idle())
+
+        self.engine.start()
+        self.assertEqual(self.engine.skipped_frames, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# encoding: utf-8
+
+import unittest
+
+from pytaVSL.engine.patterns import OscStore, osc_to_regexp, osc_expand_braces, PATTERN_CACHE_SIZE
+
+NAMES = [
+    'a', 'b', 'ab', 'abc', 'aab', 'axb', 'a1', 'a2', 'a.b', 'a+b', 'a,b', 'a$', 'a^b', 'a?', 'a*b',
+    'a[1]', 'a{b}', 'a\\b', 'a\\bc', 'b\\', 'x', 'y', 'x|y', '(a)',
+    'act1_bg_001', 'act1_bg_002', 'act1_fg_010', 'act2_bg_017', 'act2_bg_117', 'act2_fx_017', 'act10_bg_001',
+]
+
+PATTERNS = [
+    # wildcards
+    '*', 'a*', 'a?', 'ab*', 'act1_*', 'act?_bg_*', '*_bg_017', 'act2_bg_0[0-9][0-9]', 'act[12]_*', 'a[!1]',
+    # braces
+    '{}', 'a{}', 'a{}*', '{a,}*', '{a,b}', '{a,b}*', 'act{1,2}_bg_*', 'act2_{bg,fx}_017', '{act1,act2}_bg_0{0,1}7',
+    '{a,b', 'a}*', 'a{b,c}}', '[{]*', '[a{]*', 'a[{b,c}]',
+    # regexp characters passed through
+    'a\\b*', 'a\\b', 'a\\*', 'b\\*', '{a,b}\\*', 'x|y', 'x|*', 'a.*', 'a.b', 'a+b*', '(a)*', '{a,b}+',
+    'a$*', 'a^*',
+]
+
+def scan(store, pattern):
+    """
+    Reference: match every name with the pattern's regexp
+    """
+    regexp = osc_to_regexp(pattern)
+    return [store[name] for name in store if name and regexp.match(name)]
+
+class OscStoreTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.store = OscStore()
+        for name in NAMES:
+            self.store[name] = name
+
+    def assertMatchesScan(self, pattern):
+
+        self.store.matches.clear()
+        self.assertEqual(self.store.match(pattern), scan(self.store, pattern), pattern)
+
+    def test_patterns(self):
+
+        for pattern in PATTERNS:
+            try:
+                osc_to_regexp(pattern)
+            except Exception:
+                # not a valid pattern
+                continue
+            self.assertMatchesScan(pattern)
+
+    def test_updates(self):
+
+        self.assertEqual(self.store.match('act2_*'), ['act2_bg_017', 'act2_bg_117', 'act2_fx_017'])
+
+        del self.store['act2_bg_117']
+        self.store.pop('act2_fx_017')
+        self.store['act2_bg_000'] = 'act2_bg_000'
+        self.store['act2_bg_017'] = 'act2_bg_017'
+
+        # insertion order is kept
+        self.assertEqual(self.store.match('act2_*'), ['act2_bg_017', 'act2_bg_000'])
+        self.assertEqual(self.store.names, sorted(self.store))
+
+        for pattern in PATTERNS[:20]:
+            self.assertMatchesScan(pattern)
+
+        self.store.clear()
+        self.assertEqual(self.store.match('act2_*'), [])
+
+    def test_cache_size(self):
+
+        self.store.match('a*')
+        for i in range(PATTERN_CACHE_SIZE):
+            # recently used pattern is kept
+            self.store.match('a*')
+            self.store.match('b%i' % i)
+
+        self.assertEqual(len(self.store.matches), PATTERN_CACHE_SIZE)
+        self.assertIn('a*', self.store.matches)
+        self.assertNotIn('b0', self.store.matches)
+
+    def test_expand_braces(self):
+
+        self.assertEqual(osc_expand_braces('a{b,c}[0-9]{x,y}'), ['ab[0-9]x', 'ab[0-9]y', 'ac[0-9]x', 'ac[0-9]y'])
+        self.assertEqual(osc_expand_braces('a[{b,c}]'), ['a[{b,c}]'])
+        self.assertEqual(osc_expand_braces('{a,b,c,d,e,f,g,h}{a,b,c,d,e,f,g,h}{a,b}'), ['{a,b,c,d,e,f,g,h}{a,b,c,d,e,f,g,h}{a,b}'])
+
+if __name__ == '__main__':
+    unittest.main()
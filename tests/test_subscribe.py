@@ -0,0 +1,99 @@
+# encoding: utf-8
+
+import unittest
+
+try:
+    from pytaVSL.engine.osc import OscNode, osc_property
+except ImportError:
+    OscNode = None
+
+if OscNode is not None:
+
+    class Node(OscNode):
+        """
+        Osc node that records updates instead of sending them
+        """
+        def __init__(self):
+
+            self.pos_x = 0.0
+            self.pos_y = 0.0
+            self.width = 1.0
+            self.frame = 0
+            self.frame_position = 0.0
+            self.updates = []
+            self.fed = []
+            self.server = self
+
+            super(Node, self).__init__()
+
+        def send(self, port, address, property, *value):
+
+            self.updates.append((property, list(value)))
+
+        def osc_feed_subscribers_property(self, property):
+
+            self.fed.append(property)
+            super(Node, self).osc_feed_subscribers_property(property)
+
+        @osc_property('position', 'pos_x', 'pos_y')
+        def set_position(self, x, y):
+            self.pos_x = x
+            self.pos_y = y
+
+        @osc_property('position_x', 'pos_x', shorthand=True)
+        def set_position_x(self, x):
+            self.set_position(x, self.pos_y)
+
+        @osc_property('width', 'width')
+        def set_width(self, width):
+            self.width = width
+
+        @osc_property('frame', 'frame')
+        def set_frame(self, frame):
+            self.frame = frame
+            self.frame_position = frame / 10.
+            self.osc_set_changed('frame_position')
+
+        @osc_property('frame_position', 'frame_position')
+        def set_frame_position(self, position):
+            self.set_frame(int(position * 10))
+
+@unittest.skipIf(OscNode is None, 'requires pyliblo3')
+class SubscribeTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.node = Node()
+        for property in ['position', 'position_x', 'width', 'frame_position']:
+            self.node.osc_subscribe(property, 5555)
+        self.node.updates = []
+
+    def feed(self):
+
+        self.node.fed = []
+        self.node.osc_feed_subscribers()
+        updates, self.node.updates = self.node.updates, []
+        # only changed properties are checked
+        self.assertEqual(sorted(self.node.fed), [property for property, value in sorted(updates)])
+        return sorted(updates)
+
+    def test_changed_properties(self):
+
+        self.assertEqual(self.feed(), [])
+
+        self.node.set_width(2.0)
+        self.assertEqual(self.feed(), [('width', [2.0])])
+        self.assertEqual(self.node.osc_dirty, set())
+
+        # shorthand and full property share attributes
+        self.node.set_position(1.0, 2.0)
+        self.assertEqual(self.feed(), [('position', [1.0, 2.0]), ('position_x', [1.0])])
+        self.node.set_position_x(3.0)
+        self.assertEqual(self.feed(), [('position', [3.0, 2.0]), ('position_x', [3.0])])
+
+        # changed by another property's setter
+        self.node.set_frame(5)
+        self.assertEqual(self.feed(), [('frame_position', [0.5])])
+
+if __name__ == '__main__':
+    unittest.main()